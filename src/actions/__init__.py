@@ -3,7 +3,8 @@
 from src.actions.base_action import BaseAction
 from src.actions.action_registry import ActionRegistry
 from src.actions.action_dispatcher import ActionDispatcher
+from src.actions.dispatch_worker import DispatchWorker
 
-__all__ = ["BaseAction", "ActionRegistry", "ActionDispatcher"]
+__all__ = ["BaseAction", "ActionRegistry", "ActionDispatcher", "DispatchWorker"]
 
 
@@ -1,7 +1,12 @@
 """Action dispatcher to manage and route actions"""
 
-from typing import Dict, List, Tuple
+import logging
+from array import array
+from typing import List, Optional, Tuple
 from src.actions.base_action import BaseAction
+from src.actions.action_registry import ActionRegistry
+
+_log = logging.getLogger(__name__)
 
 
 class ActionDispatcher:
@@ -9,92 +14,102 @@ class ActionDispatcher:
     
     def __init__(self):
         """Initialize action dispatcher"""
-        self.active_actions: Dict[str, Tuple[BaseAction, float]] = {}
+        # Per-gesture state indexed by gesture ID (position in the loaded gesture list)
+        self._names: List[str] = []
+        self._actions: List[Optional[BaseAction]] = []  # Active action, or None if inactive
+        self._values = array('d')  # Last trigger value
+        self._last_seen = array('q')  # Frame id when last seen active
+        self._active_count = 0
+        self._frame_id = 0
+    
+    def set_gestures(self, gesture_names: List[str]):
+        """
+        Size per-gesture state for a newly loaded gesture list.
         
-    def dispatch(self, gesture_activations: List[Tuple[str, BaseAction, bool, float]]):
+        Any currently active actions are released first.
+        
+        Args:
+            gesture_names: Gesture names in gesture ID order
+        """
+        self.release_all()
+        count = len(gesture_names)
+        self._names = list(gesture_names)
+        self._actions = [None] * count
+        self._values = array('d', [0.0]) * count
+        self._last_seen = array('q', [0]) * count
+    
+    def dispatch(self, gesture_activations: List[Tuple[int, BaseAction, bool, float]]):
         """
         Dispatch actions based on gesture activations.
         
         Args:
-            gesture_activations: List of (gesture_name, action, is_active, trigger_value) tuples
+            gesture_activations: List of (gesture_id, action, is_active, trigger_value) tuples
         """
-        # Track which gestures are currently active
-        current_active = set()
+        # Active gestures not tagged with this frame's id after the loop are released
+        self._frame_id += 1
+        frame_id = self._frame_id
+        actions = self._actions
+        values = self._values
+        last_seen = self._last_seen
         
-        for gesture_name, action, is_active, trigger_value in gesture_activations:
-            if is_active:
-                current_active.add(gesture_name)
-                
-                if gesture_name not in self.active_actions:
+        for gesture_id, action, is_active, trigger_value in gesture_activations:
+            if not is_active:
+                continue
+            
+            try:
+                if actions[gesture_id] is None:
                     # New activation - execute action
-                    try:
-                        action.execute(trigger_value)
-                        self.active_actions[gesture_name] = (action, trigger_value)
-                    except Exception as e:
-                        print(f"Warning: Failed to execute action for gesture '{gesture_name}': {e}")
+                    action.execute(trigger_value)
+                    actions[gesture_id] = action
+                    values[gesture_id] = trigger_value
+                    last_seen[gesture_id] = frame_id
+                    self._active_count += 1
                 else:
-                    # Already active - update if it's a continuous action
-                    existing_action, existing_value = self.active_actions[gesture_name]
-                    # For continuous actions (analog sticks/triggers), re-execute with new value
-                    action_name = action.get_name()
-                    
-                    # Check if this is a continuous action that needs updates
-                    is_continuous = False
-                    if action_name == "gamepad":
-                        # Gamepad analog controls need continuous updates
-                        is_continuous = ("stick" in action.control or "trigger" in action.control)
-                    elif action_name == "mouse":
-                        # Mouse move needs continuous updates
-                        is_continuous = (hasattr(action, 'action_type') and action.action_type == "move")
+                    # Already active - mark as seen, then update if it's a continuous action
+                    previous_value = values[gesture_id]
+                    actions[gesture_id] = action
+                    values[gesture_id] = trigger_value
+                    last_seen[gesture_id] = frame_id
                     
-                    if is_continuous:
-                        # Only update if value changed significantly (avoid unnecessary updates)
-                        if abs(existing_value - trigger_value) > 0.01:
-                            try:
-                                action.execute(trigger_value)
-                            except Exception as e:
-                                print(f"Warning: Failed to update action for gesture '{gesture_name}': {e}")
-                    
-                    self.active_actions[gesture_name] = (action, trigger_value)
+                    # For continuous actions (analog sticks/triggers, mouse move), re-execute with
+                    # new value, but only if it changed significantly (avoid unnecessary updates)
+                    if action.is_continuous and abs(previous_value - trigger_value) > 0.01:
+                        action.execute(trigger_value)
+            except Exception as e:
+                # gesture_id may itself be the problem (out of range for the loaded gestures)
+                names = self._names
+                name = names[gesture_id] if 0 <= gesture_id < len(names) else gesture_id
+                _log.warning("Failed to execute action for gesture %r: %s", name, e)
         
         # Release actions that are no longer active
-        gestures_to_release = []
-        for gesture_name in self.active_actions.keys():
-            if gesture_name not in current_active:
-                gestures_to_release.append(gesture_name)
+        if self._active_count:
+            for gesture_id in range(len(actions)):
+                if actions[gesture_id] is not None and last_seen[gesture_id] != frame_id:
+                    self._release(gesture_id)
         
-        for gesture_name in gestures_to_release:
-            action, _ = self.active_actions[gesture_name]
-            try:
-                action.release()
-                # Reset state for press-mode actions to allow re-triggering
-                # Only reset if method exists (optional method)
-                if hasattr(action, 'reset_state'):
-                    try:
-                        action.reset_state()
-                    except Exception as e:
-                        print(f"Warning: reset_state failed for '{gesture_name}': {e}")
-            except Exception as e:
-                print(f"Warning: Failed to release action for gesture '{gesture_name}': {e}")
-            del self.active_actions[gesture_name]
+        # Send batched device updates once for the whole frame
+        ActionRegistry.flush_all()
     
     def release_all(self):
-        """Release all active actions"""
-        for gesture_name, (action, _) in list(self.active_actions.items()):
-            try:
-                action.release()
-                # Reset state if method exists
-                if hasattr(action, 'reset_state'):
-                    try:
-                        action.reset_state()
-                    except Exception:
-                        pass  # Ignore reset errors during cleanup
-            except Exception as e:
-                print(f"Warning: Failed to release action '{gesture_name}': {e}")
-        self.active_actions.clear()
+        """Release all active actions (no-op when none are active)"""
+        if self._active_count:
+            for gesture_id in range(len(self._actions)):
+                if self._actions[gesture_id] is not None:
+                    self._release(gesture_id)
+            ActionRegistry.flush_all()
+    
+    def _release(self, gesture_id: int):
+        """Release the active action of a gesture and mark it inactive"""
+        action = self._actions[gesture_id]
+        self._actions[gesture_id] = None
+        self._active_count -= 1
+        try:
+            action.release()
+            # Reset state for press-mode actions to allow re-triggering
+            action.reset_state()
+        except Exception as e:
+            _log.warning("Failed to release action for gesture %r: %s", self._names[gesture_id], e)
     
     def get_active_count(self) -> int:
         """Get number of currently active actions"""
-        return len(self.active_actions)
-
-
+        return self._active_count
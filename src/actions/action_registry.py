@@ -1,13 +1,17 @@
 """Registry for action types using plugin pattern"""
 
-from typing import Dict, Type, Any
+import types
+from typing import Dict, Type, Any, Mapping, Optional, Tuple
 from src.actions.base_action import BaseAction
 
 
 class ActionRegistry:
     """Registry for managing action types"""
     
-    _actions: Dict[str, Type[BaseAction]] = {}
+    _actions: Mapping[str, Type[BaseAction]] = {}
+    
+    # Snapshot of registered names, set once the registry is frozen
+    _available: Optional[Tuple[str, ...]] = None
     
     @classmethod
     def register(cls, name: str):
@@ -26,6 +30,8 @@ class ActionRegistry:
                 ...
         """
         def decorator(action_class: Type[BaseAction]):
+            if cls._available is not None:
+                raise RuntimeError(f"Cannot register action type '{name}': registry is frozen")
             cls._actions[name] = action_class
             return action_class
         return decorator
@@ -45,21 +51,42 @@ class ActionRegistry:
         Raises:
             KeyError: If action type not registered
         """
-        if name not in cls._actions:
-            raise KeyError(f"Action type '{name}' not registered. Available: {list(cls._actions.keys())}")
+        try:
+            action_class = cls._actions[name]
+        except KeyError:
+            raise KeyError(f"Action type '{name}' not registered. Available: {list(cls._actions)}") from None
         
-        action_class = cls._actions[name]
         return action_class(config)
     
     @classmethod
-    def get_available_actions(cls) -> list:
+    def freeze(cls):
+        """
+        Make the registry read-only once all built-in actions are registered.
+        
+        Also snapshots the available action names so later lookups don't
+        rebuild them.
+        """
+        if cls._available is None:
+            cls._actions = types.MappingProxyType(dict(cls._actions))
+            cls._available = tuple(cls._actions)
+    
+    @classmethod
+    def flush_all(cls):
+        """Flush batched device state for every registered action type"""
+        for action_class in cls._actions.values():
+            action_class.flush()
+    
+    @classmethod
+    def get_available_actions(cls) -> Tuple[str, ...]:
         """
-        Get list of all registered action types.
+        Get all registered action types.
         
         Returns:
-            List of action type names
+            Tuple of action type names
         """
-        return list(cls._actions.keys())
+        if cls._available is not None:
+            return cls._available
+        return tuple(cls._actions)
     
     @classmethod
     def is_registered(cls, name: str) -> bool:
@@ -7,6 +7,9 @@ from typing import Dict, Any
 class BaseAction(ABC):
     """Abstract base class for actions"""
     
+    # Fixed attribute layout; executors declare their own attributes the same way
+    __slots__ = ("config", "is_executing", "is_continuous")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize action with configuration.
@@ -17,6 +20,11 @@ class BaseAction(ABC):
         self.config = config
         self.is_executing = False
         
+        # Whether the action needs re-executing while its gesture stays active
+        # (analog sticks, triggers, mouse movement). Executors set this once at
+        # construction so the dispatcher does not have to probe per frame.
+        self.is_continuous = False
+        
     @abstractmethod
     def execute(self, trigger_value: float):
         """
@@ -32,6 +40,20 @@ class BaseAction(ABC):
         """Release/stop the action"""
         pass
     
+    def reset_state(self):
+        """Reset internal state (called when gesture becomes inactive)"""
+        pass
+    
+    @classmethod
+    def flush(cls):
+        """
+        Submit device state batched by execute/release.
+        
+        Called once per dispatch frame so several actions sharing a device
+        produce a single report instead of one each.
+        """
+        pass
+    
     @abstractmethod
     def get_name(self) -> str:
         """
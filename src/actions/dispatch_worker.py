@@ -0,0 +1,125 @@
+"""Background thread that runs action dispatch off the frame processing thread"""
+
+import logging
+import threading
+from typing import List, Optional, Tuple
+from src.actions.action_dispatcher import ActionDispatcher
+from src.actions.base_action import BaseAction
+
+_log = logging.getLogger(__name__)
+
+# Pending command asking the thread to release all active actions
+_RELEASE = object()
+
+
+class DispatchWorker:
+    """
+    Runs an ActionDispatcher on its own thread so slow input injection (keyboard, mouse,
+    gamepad) never stalls frame processing.
+    
+    Work goes through a single "latest wins" slot. Every command describes the full
+    gesture state for a frame (dispatch() releases whatever is no longer active), so a
+    pending command the thread has not started yet can be replaced by a newer one.
+    """
+    
+    def __init__(self, dispatcher: ActionDispatcher):
+        """
+        Initialize dispatch worker.
+        
+        Args:
+            dispatcher: Dispatcher to drive; only call it through this worker while started
+        """
+        self.dispatcher = dispatcher
+        self.is_running = False
+        
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)  # Notified when _pending is set or on stop
+        self._pending: object = None  # Latest activations list, _RELEASE, or None
+        self._released = True  # Last command taken by the thread was a release
+    
+    def start(self):
+        """Start the dispatch thread"""
+        if self.is_running:
+            return
+        self.join()
+        self._pending = None
+        self._released = True
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, name="ActionDispatch", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the dispatch thread, dropping pending work, and release all active actions"""
+        if self._thread is None:
+            self.dispatcher.release_all()
+            return
+        
+        # The dispatcher is not thread-safe, so the release is left to the dispatch thread as
+        # its final command, even if it is still blocked in a device call past the timeout
+        with self._lock:
+            self.is_running = False
+            self._pending = _RELEASE
+            self._wake.notify()
+        self._thread.join(timeout=2.0)
+        if not self._thread.is_alive():
+            self._thread = None
+    
+    def join(self):
+        """
+        Wait for a dispatch thread left running by a timed-out stop() to finish its release.
+        
+        Call this before reconfiguring the dispatcher after stop(), since until then the old
+        thread may still be using it.
+        """
+        if self.is_running or self._thread is None:
+            return
+        self._thread.join()
+        self._thread = None
+    
+    def submit(self, gesture_activations: List[Tuple[int, BaseAction, bool, float]]):
+        """
+        Queue a frame's gesture activations for dispatch, replacing any not yet dispatched.
+        
+        Args:
+            gesture_activations: List of (gesture_id, action, is_active, trigger_value) tuples,
+                not modified by the caller afterwards
+        """
+        self._put(gesture_activations)
+    
+    def release_all(self):
+        """Queue release of all active actions, replacing any activations not yet dispatched"""
+        with self._lock:
+            # Nothing can be held since the last release: skip waking the thread (no-person idle)
+            if not self.is_running or (self._pending is None and self._released):
+                return
+            self._pending = _RELEASE
+            self._wake.notify()
+    
+    def _put(self, command: object):
+        """Store a command in the pending slot and wake the thread (ignored once stopped)"""
+        with self._lock:
+            if not self.is_running:
+                return
+            self._pending = command
+            self._wake.notify()
+    
+    def _run(self):
+        """Dispatch loop (runs on the dispatch thread)"""
+        while True:
+            with self._lock:
+                self._wake.wait_for(lambda: self._pending is not None or not self.is_running)
+                # Once stopped, only the final release queued by stop() is still run
+                if self._pending is None:
+                    return
+                command = self._pending
+                self._pending = None
+                self._released = command is _RELEASE
+            
+            try:
+                if command is _RELEASE:
+                    self.dispatcher.release_all()
+                else:
+                    self.dispatcher.dispatch(command)
+            except Exception:
+                _log.warning("Action dispatch failed", exc_info=True)
@@ -4,6 +4,10 @@
 from src.actions.executors.keyboard_action import KeyboardAction
 from src.actions.executors.mouse_action import MouseAction
 from src.actions.executors.gamepad_action import GamepadAction
+from src.actions.action_registry import ActionRegistry
+
+# All built-in actions are registered now
+ActionRegistry.freeze()
 
 __all__ = ["KeyboardAction", "MouseAction", "GamepadAction"]
 
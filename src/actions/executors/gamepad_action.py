@@ -1,33 +1,37 @@
 """Gamepad action executor using vgamepad"""
 
+import logging
+import sys
 from typing import Dict, Any
 import vgamepad as vg
 from src.actions.base_action import BaseAction
 from src.actions.action_registry import ActionRegistry
 from src.utils.constants import GAMEPAD_STICK_MAX_VALUE, GAMEPAD_TRIGGER_MAX_VALUE
 
+_log = logging.getLogger(__name__)
+
 
 @ActionRegistry.register("gamepad")
 class GamepadAction(BaseAction):
     """Simulates Xbox 360 controller input"""
     
+    __slots__ = ("gamepad", "control", "value", "_button_code", "_stick_scale", "_trigger_scale",
+                 "_last_scaled", "_execute_impl", "_release_impl")
+    
     # Shared gamepad instance (singleton pattern)
     _gamepad = None
     
-    # Button mappings
+    # Set when virtual pad state changed; the report is sent once per frame by flush()
+    _dirty = False
+    
+    # Button mappings (canonical names only)
     BUTTONS = {
         "a": vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
-        "button_a": vg.XUSB_BUTTON.XUSB_GAMEPAD_A,
         "b": vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
-        "button_b": vg.XUSB_BUTTON.XUSB_GAMEPAD_B,
         "x": vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
-        "button_x": vg.XUSB_BUTTON.XUSB_GAMEPAD_X,
         "y": vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
-        "button_y": vg.XUSB_BUTTON.XUSB_GAMEPAD_Y,
         "lb": vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
-        "left_bumper": vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_SHOULDER,
         "rb": vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
-        "right_bumper": vg.XUSB_BUTTON.XUSB_GAMEPAD_RIGHT_SHOULDER,
         "back": vg.XUSB_BUTTON.XUSB_GAMEPAD_BACK,
         "start": vg.XUSB_BUTTON.XUSB_GAMEPAD_START,
         "left_thumb": vg.XUSB_BUTTON.XUSB_GAMEPAD_LEFT_THUMB,
@@ -38,6 +42,16 @@ class GamepadAction(BaseAction):
         "dpad_right": vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT,
     }
     
+    # Alternative button names mapped to their canonical BUTTONS key
+    BUTTON_ALIASES = {
+        "button_a": "a",
+        "button_b": "b",
+        "button_x": "x",
+        "button_y": "y",
+        "left_bumper": "lb",
+        "right_bumper": "rb",
+    }
+    
     @classmethod
     def get_gamepad(cls):
         """Get or create the shared gamepad instance"""
@@ -45,6 +59,13 @@ class GamepadAction(BaseAction):
             cls._gamepad = vg.VX360Gamepad()
         return cls._gamepad
     
+    @classmethod
+    def flush(cls):
+        """Send a single update report for all gamepad changes made this frame"""
+        if cls._dirty and cls._gamepad is not None:
+            cls._gamepad.update()
+        cls._dirty = False
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize gamepad action.
@@ -56,86 +77,130 @@ class GamepadAction(BaseAction):
         """
         super().__init__(config)
         self.gamepad = self.get_gamepad()
-        self.control = self.get_config_param("control", "button_a").lower()
-        self.value = self.get_config_param("value", 1.0)
+        self.control = sys.intern(config.get("control", "button_a").lower())
+        self.value = config.get("value", 1.0)
+        self.is_continuous = "stick" in self.control or "trigger" in self.control
+        
+        # Resolve the control once so execute/release don't re-test the control name per frame
+        self._button_code = self.BUTTONS.get(self.BUTTON_ALIASES.get(self.control, self.control))
+        self._stick_scale = self.value * GAMEPAD_STICK_MAX_VALUE
+        self._trigger_scale = self.value * GAMEPAD_TRIGGER_MAX_VALUE
+        self._last_scaled = None
+        
+        if self._button_code is not None:
+            self._execute_impl, self._release_impl = self._exec_button, self._release_button
+        else:
+            handlers = {
+                "left_stick_x": (self._exec_left_stick_x, self._release_left_stick),
+                "left_stick_y": (self._exec_left_stick_y, self._release_left_stick),
+                "right_stick_x": (self._exec_right_stick_x, self._release_right_stick),
+                "right_stick_y": (self._exec_right_stick_y, self._release_right_stick),
+                "left_trigger": (self._exec_left_trigger, self._release_left_trigger),
+                "right_trigger": (self._exec_right_trigger, self._release_right_trigger),
+            }
+            self._execute_impl, self._release_impl = handlers.get(
+                self.control, (self._exec_unknown, self._release_unknown)
+            )
         
     def execute(self, trigger_value: float):
         """Execute gamepad action"""
         try:
-            if self.control in self.BUTTONS:
-                # Button press - only execute once
-                if not self.is_executing:
-                    self.gamepad.press_button(self.BUTTONS[self.control])
-                    self.gamepad.update()
-                    self.is_executing = True
-                
-            elif self.control == "left_stick_x":
-                # Analog stick - update continuously
-                scaled_value = int(self.value * trigger_value * GAMEPAD_STICK_MAX_VALUE)
-                self.gamepad.left_joystick(x_value=scaled_value, y_value=0)
-                self.gamepad.update()
-                self.is_executing = True
-                
-            elif self.control == "left_stick_y":
-                scaled_value = int(self.value * trigger_value * GAMEPAD_STICK_MAX_VALUE)
-                self.gamepad.left_joystick(x_value=0, y_value=scaled_value)
-                self.gamepad.update()
-                self.is_executing = True
-                
-            elif self.control == "right_stick_x":
-                scaled_value = int(self.value * trigger_value * GAMEPAD_STICK_MAX_VALUE)
-                self.gamepad.right_joystick(x_value=scaled_value, y_value=0)
-                self.gamepad.update()
-                self.is_executing = True
-                
-            elif self.control == "right_stick_y":
-                scaled_value = int(self.value * trigger_value * GAMEPAD_STICK_MAX_VALUE)
-                self.gamepad.right_joystick(x_value=0, y_value=scaled_value)
-                self.gamepad.update()
-                self.is_executing = True
-                
-            elif self.control == "left_trigger":
-                # Analog trigger - update continuously
-                scaled_value = int(self.value * trigger_value * GAMEPAD_TRIGGER_MAX_VALUE)
-                self.gamepad.left_trigger(scaled_value)
-                self.gamepad.update()
-                self.is_executing = True
-                
-            elif self.control == "right_trigger":
-                scaled_value = int(self.value * trigger_value * GAMEPAD_TRIGGER_MAX_VALUE)
-                self.gamepad.right_trigger(scaled_value)
-                self.gamepad.update()
-                self.is_executing = True
+            self._execute_impl(trigger_value)
         except Exception as e:
-            print(f"Warning: Gamepad action failed for control '{self.control}': {e}")
-            import traceback
-            traceback.print_exc()
+            _log.warning("Gamepad action failed for control %r: %s", self.control, e, exc_info=True)
     
     def release(self):
         """Release gamepad control"""
         if self.is_executing:
-            if self.control in self.BUTTONS:
-                # Release button
-                self.gamepad.release_button(self.BUTTONS[self.control])
-                self.gamepad.update()
-                
-            elif "stick" in self.control:
-                # Reset stick to center
-                if "left" in self.control:
-                    self.gamepad.left_joystick(x_value=0, y_value=0)
-                else:
-                    self.gamepad.right_joystick(x_value=0, y_value=0)
-                self.gamepad.update()
-                
-            elif "trigger" in self.control:
-                # Reset trigger to 0
-                if "left" in self.control:
-                    self.gamepad.left_trigger(0)
-                else:
-                    self.gamepad.right_trigger(0)
-                self.gamepad.update()
-            
+            self._release_impl()
         self.is_executing = False
+        self._last_scaled = None
+    
+    def _exec_button(self, trigger_value: float):
+        # Button press - only execute once
+        if not self.is_executing:
+            self.gamepad.press_button(self._button_code)
+            GamepadAction._dirty = True
+            self.is_executing = True
+    
+    def _exec_left_stick_x(self, trigger_value: float):
+        # Analog stick - update continuously, skipping values that quantize to the last one sent
+        scaled = int(self._stick_scale * trigger_value)
+        if scaled != self._last_scaled:
+            self.gamepad.left_joystick(x_value=scaled, y_value=0)
+            self._last_scaled = scaled
+            GamepadAction._dirty = True
+        self.is_executing = True
+    
+    def _exec_left_stick_y(self, trigger_value: float):
+        scaled = int(self._stick_scale * trigger_value)
+        if scaled != self._last_scaled:
+            self.gamepad.left_joystick(x_value=0, y_value=scaled)
+            self._last_scaled = scaled
+            GamepadAction._dirty = True
+        self.is_executing = True
+    
+    def _exec_right_stick_x(self, trigger_value: float):
+        scaled = int(self._stick_scale * trigger_value)
+        if scaled != self._last_scaled:
+            self.gamepad.right_joystick(x_value=scaled, y_value=0)
+            self._last_scaled = scaled
+            GamepadAction._dirty = True
+        self.is_executing = True
+    
+    def _exec_right_stick_y(self, trigger_value: float):
+        scaled = int(self._stick_scale * trigger_value)
+        if scaled != self._last_scaled:
+            self.gamepad.right_joystick(x_value=0, y_value=scaled)
+            self._last_scaled = scaled
+            GamepadAction._dirty = True
+        self.is_executing = True
+    
+    def _exec_left_trigger(self, trigger_value: float):
+        # Analog trigger - update continuously
+        scaled = int(self._trigger_scale * trigger_value)
+        if scaled != self._last_scaled:
+            self.gamepad.left_trigger(scaled)
+            self._last_scaled = scaled
+            GamepadAction._dirty = True
+        self.is_executing = True
+    
+    def _exec_right_trigger(self, trigger_value: float):
+        scaled = int(self._trigger_scale * trigger_value)
+        if scaled != self._last_scaled:
+            self.gamepad.right_trigger(scaled)
+            self._last_scaled = scaled
+            GamepadAction._dirty = True
+        self.is_executing = True
+    
+    def _exec_unknown(self, trigger_value: float):
+        # Unknown control - nothing to do
+        pass
+    
+    def _release_button(self):
+        self.gamepad.release_button(self._button_code)
+        GamepadAction._dirty = True
+    
+    def _release_left_stick(self):
+        # Reset stick to center
+        self.gamepad.left_joystick(x_value=0, y_value=0)
+        GamepadAction._dirty = True
+    
+    def _release_right_stick(self):
+        self.gamepad.right_joystick(x_value=0, y_value=0)
+        GamepadAction._dirty = True
+    
+    def _release_left_trigger(self):
+        # Reset trigger to 0
+        self.gamepad.left_trigger(0)
+        GamepadAction._dirty = True
+    
+    def _release_right_trigger(self):
+        self.gamepad.right_trigger(0)
+        GamepadAction._dirty = True
+    
+    def _release_unknown(self):
+        pass
     
     def get_name(self) -> str:
         """Get action type name"""
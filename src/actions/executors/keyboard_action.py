@@ -1,15 +1,28 @@
 """Keyboard action executor using pynput"""
 
+import logging
+import sys
 from typing import Dict, Any
 from pynput.keyboard import Controller, Key
 from src.actions.base_action import BaseAction
 from src.actions.action_registry import ActionRegistry
 
+_log = logging.getLogger(__name__)
+
+# Interned mode names so execute/release can compare by identity
+_PRESS = sys.intern("press")
+_HOLD = sys.intern("hold")
+
 
 @ActionRegistry.register("keyboard")
 class KeyboardAction(BaseAction):
     """Simulates keyboard input"""
     
+    __slots__ = ("keyboard", "key_str", "mode", "key", "_was_active")
+    
+    # Shared keyboard controller (singleton pattern)
+    _controller = None
+    
     # Map string keys to pynput Key enum
     SPECIAL_KEYS = {
         "space": Key.space,
@@ -34,6 +47,13 @@ class KeyboardAction(BaseAction):
         "f9": Key.f9, "f10": Key.f10, "f11": Key.f11, "f12": Key.f12,
     }
     
+    @classmethod
+    def get_controller(cls):
+        """Get or create the shared keyboard controller"""
+        if cls._controller is None:
+            cls._controller = Controller()
+        return cls._controller
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize keyboard action.
@@ -43,9 +63,12 @@ class KeyboardAction(BaseAction):
             mode: "press" (tap) or "hold" (continuous)
         """
         super().__init__(config)
-        self.keyboard = Controller()
-        self.key_str = self.get_config_param("key", "space").lower()
-        self.mode = self.get_config_param("mode", "press").lower()
+        self.keyboard = self.get_controller()
+        self.key_str = config.get("key", "space").lower()
+        self.mode = sys.intern(config.get("mode", "press").lower())
+        
+        # Previous state for press-mode edge detection
+        self._was_active = False
         
         # Convert string to key
         if self.key_str in self.SPECIAL_KEYS:
@@ -57,29 +80,21 @@ class KeyboardAction(BaseAction):
     def execute(self, trigger_value: float):
         """Execute keyboard action"""
         try:
-            if self.mode == "press":
+            if self.mode is _PRESS:
                 # One-shot press (tap) - execute on edge (transition from inactive to active)
-                # Track previous state to detect edge
-                if not hasattr(self, '_was_active'):
-                    self._was_active = False
-                
                 # Only execute if transitioning from inactive to active (edge detection)
                 if not self._was_active:
                     self.keyboard.press(self.key)
                     self.keyboard.release(self.key)
                     self._was_active = True
                     self.is_executing = True
-            elif self.mode == "hold":
+            elif self.mode is _HOLD:
                 # Continuous hold - only press once, release when gesture ends
                 if not self.is_executing:
                     self.keyboard.press(self.key)
                     self.is_executing = True
-                    if not hasattr(self, '_was_active'):
-                        self._was_active = True
         except Exception as e:
-            print(f"Warning: Keyboard action failed for key '{self.key_str}': {e}")
-            import traceback
-            traceback.print_exc()
+            _log.warning("Keyboard action failed for key %r: %s", self.key_str, e, exc_info=True)
             # Don't set is_executing if it failed
     
     def reset_state(self):
@@ -90,15 +105,14 @@ class KeyboardAction(BaseAction):
     def release(self):
         """Release key if held"""
         try:
-            if self.is_executing and self.mode == "hold":
+            if self.is_executing and self.mode is _HOLD:
                 self.keyboard.release(self.key)
         except Exception as e:
-            print(f"Warning: Keyboard release failed: {e}")
+            _log.warning("Keyboard release failed: %s", e)
         finally:
             self.is_executing = False
             # Reset state for next activation
-            if hasattr(self, '_was_active'):
-                self._was_active = False
+            self._was_active = False
     
     def get_name(self) -> str:
         """Get action type name"""
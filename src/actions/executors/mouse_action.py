@@ -1,21 +1,43 @@
 """Mouse action executor using pynput"""
 
+import logging
+import sys
 from typing import Dict, Any
 from pynput.mouse import Controller, Button
 from src.actions.base_action import BaseAction
 from src.actions.action_registry import ActionRegistry
 
+_log = logging.getLogger(__name__)
+
+# Interned action names so execute/release can compare by identity
+_CLICK = sys.intern("click")
+_HOLD = sys.intern("hold")
+_MOVE = sys.intern("move")
+
 
 @ActionRegistry.register("mouse")
 class MouseAction(BaseAction):
     """Simulates mouse input"""
     
+    __slots__ = ("mouse", "action_type", "button_str", "button", "x", "y", "relative",
+                 "_dx_scale", "_dy_scale", "_execute_impl")
+    
+    # Shared mouse controller (singleton pattern)
+    _mouse = None
+    
     BUTTONS = {
         "left": Button.left,
         "right": Button.right,
         "middle": Button.middle,
     }
     
+    @classmethod
+    def get_mouse(cls):
+        """Get or create the shared mouse controller"""
+        if cls._mouse is None:
+            cls._mouse = Controller()
+        return cls._mouse
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize mouse action.
@@ -28,56 +50,73 @@ class MouseAction(BaseAction):
             relative: Boolean, if True uses relative movement (for move)
         """
         super().__init__(config)
-        self.mouse = Controller()
-        self.action_type = self.get_config_param("action", "click").lower()
-        self.button_str = self.get_config_param("button", "left").lower()
+        self.mouse = self.get_mouse()
+        self.action_type = sys.intern(config.get("action", "click").lower())
+        self.button_str = config.get("button", "left").lower()
         self.button = self.BUTTONS.get(self.button_str, Button.left)
-        self.x = self.get_config_param("x", 0.5)
-        self.y = self.get_config_param("y", 0.5)
-        self.relative = self.get_config_param("relative", False)
+        self.x = config.get("x", 0.5)
+        self.y = config.get("y", 0.5)
+        self.relative = config.get("relative", False)
+        self.is_continuous = self.action_type is _MOVE
+        
+        # Relative movement per unit of trigger value, folded once here
+        self._dx_scale = (self.x - 0.5) * 20
+        self._dy_scale = (self.y - 0.5) * 20
+        
+        # Resolve the action once so execute doesn't branch on action_type per frame
+        if self.action_type is _MOVE:
+            self._execute_impl = self._exec_move_rel if self.relative else self._exec_move_abs
+        else:
+            handlers = {
+                _CLICK: self._exec_click,
+                _HOLD: self._exec_hold,
+            }
+            self._execute_impl = handlers.get(self.action_type, self._exec_unknown)
         
     def execute(self, trigger_value: float):
         """Execute mouse action"""
-        if self.action_type == "click":
-            # One-shot click
-            if not self.is_executing:
-                self.mouse.click(self.button, 1)
-                self.is_executing = True
-                
-        elif self.action_type == "hold":
-            # Hold button down
-            if not self.is_executing:
-                self.mouse.press(self.button)
-                self.is_executing = True
-                
-        elif self.action_type == "move":
-            # Move mouse (can use trigger_value for analog control)
+        self._execute_impl(trigger_value)
+    
+    def _exec_click(self, trigger_value: float):
+        # One-shot click
+        if not self.is_executing:
+            self.mouse.click(self.button, 1)
+            self.is_executing = True
+    
+    def _exec_hold(self, trigger_value: float):
+        # Hold button down
+        if not self.is_executing:
+            self.mouse.press(self.button)
+            self.is_executing = True
+    
+    def _exec_move_rel(self, trigger_value: float):
+        # Relative movement (trigger_value gives analog control)
+        try:
+            self.mouse.move(int(self._dx_scale * trigger_value), int(self._dy_scale * trigger_value))
+            self.is_executing = True
+        except Exception as e:
+            _log.warning("Mouse move failed: %s", e)
+    
+    def _exec_move_abs(self, trigger_value: float):
+        # Absolute position (requires screen size)
+        try:
             try:
-                if self.relative:
-                    # Relative movement
-                    dx = int((self.x - 0.5) * 20 * trigger_value)
-                    dy = int((self.y - 0.5) * 20 * trigger_value)
-                    self.mouse.move(dx, dy)
-                else:
-                    # Absolute position (requires screen size)
-                    # Get screen dimensions for absolute positioning
-                    try:
-                        screen_width, screen_height = self.mouse.screen_size
-                        abs_x = int(self.x * screen_width)
-                        abs_y = int(self.y * screen_height)
-                        self.mouse.position = (abs_x, abs_y)
-                    except AttributeError:
-                        # Fallback to relative movement if screen_size not available
-                        dx = int((self.x - 0.5) * 20 * trigger_value)
-                        dy = int((self.y - 0.5) * 20 * trigger_value)
-                        self.mouse.move(dx, dy)
-                self.is_executing = True
-            except Exception as e:
-                print(f"Warning: Mouse move failed: {e}")
+                screen_width, screen_height = self.mouse.screen_size
+                self.mouse.position = (int(self.x * screen_width), int(self.y * screen_height))
+            except AttributeError:
+                # Fallback to relative movement if screen_size not available
+                self.mouse.move(int(self._dx_scale * trigger_value), int(self._dy_scale * trigger_value))
+            self.is_executing = True
+        except Exception as e:
+            _log.warning("Mouse move failed: %s", e)
+    
+    def _exec_unknown(self, trigger_value: float):
+        # Unknown action type - nothing to do
+        pass
     
     def release(self):
         """Release mouse button if held"""
-        if self.is_executing and self.action_type == "hold":
+        if self.is_executing and self.action_type is _HOLD:
             try:
                 self.mouse.release(self.button)
             except:
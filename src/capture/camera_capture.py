@@ -1,17 +1,28 @@
 """Camera capture module for webcam input"""
 
+import logging
+import threading
+import time
 import cv2
 import numpy as np
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from src.utils.constants import (
     DEFAULT_CAMERA_ID,
     DEFAULT_CAMERA_RESOLUTION,
     DEFAULT_CAMERA_FPS
 )
 
+_log = logging.getLogger(__name__)
+
+_FOURCC_MJPG = cv2.VideoWriter_fourcc(*"MJPG")
+
+# Frame buffers reused by the capture thread: one being written or waiting in the
+# latest-frame slot, one held by the consumer
+_RING_SIZE = 2
+
 
 class CameraCapture:
-    """Handles webcam video capture using OpenCV"""
+    """Handles webcam video capture using OpenCV on a background thread"""
     
     def __init__(self, camera_id: int = DEFAULT_CAMERA_ID, resolution: Tuple[int, int] = DEFAULT_CAMERA_RESOLUTION):
         """
@@ -26,6 +37,20 @@ class CameraCapture:
         self.capture: Optional[cv2.VideoCapture] = None
         self.is_running = False
         
+        # Capture thread and the latest frame it has read (size-1 slot). Frames are read into a
+        # small ring of reused buffers; the slot and the consumer refer to them by index.
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Condition(self._lock)  # Notified when _latest is set or capture ends
+        self._buffers: List[Optional[np.ndarray]] = [None] * _RING_SIZE
+        self._latest: Optional[int] = None  # Ring index of the unread frame
+        self._in_use: Optional[int] = None  # Ring index of the frame last handed out
+        
+        # Telemetry since start(), written by the capture thread only
+        self.frames_grabbed = 0  # Frames read from the camera
+        self.frames_skipped = 0  # Frames skipped undecoded because the consumer was busy
+        self.frames_decoded = 0  # Frames successfully decoded for the consumer
+        
     def start(self) -> bool:
         """
         Start camera capture.
@@ -41,55 +66,135 @@ class CameraCapture:
         if not self.capture.isOpened():
             return False
         
-        # Set resolution
-        self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
-        self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
+        # Prefer MJPG: many UVC cameras only reach full frame rate with it (raw YUY2 is
+        # bandwidth-limited). Ignored by drivers that don't support it.
+        self.capture.set(cv2.CAP_PROP_FOURCC, _FOURCC_MJPG)
         
-        # Set FPS
-        self.capture.set(cv2.CAP_PROP_FPS, DEFAULT_CAMERA_FPS)
+        # Set resolution and FPS, skipping values already in effect (some drivers
+        # reinitialize the stream on every set)
+        self._set_if_different(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
+        self._set_if_different(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
+        self._set_if_different(cv2.CAP_PROP_FPS, DEFAULT_CAMERA_FPS)
         
+        self._latest = None
+        self._in_use = None
+        self.frames_grabbed = 0
+        self.frames_skipped = 0
+        self.frames_decoded = 0
         self.is_running = True
+        
+        # Read frames continuously so callers never block on the driver
+        self._thread = threading.Thread(target=self._capture_loop, name="CameraCapture", daemon=True)
+        self._thread.start()
         return True
     
+    def _set_if_different(self, prop: int, value: float):
+        """Set a capture property unless the driver already reports that value"""
+        if self.capture.get(prop) != value:
+            self.capture.set(prop, value)
+    
     def stop(self):
         """Stop camera capture and release resources"""
+        self.is_running = False
+        with self._lock:
+            self._frame_ready.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
         if self.capture is not None:
             self.capture.release()
             self.capture = None
-        self.is_running = False
+        with self._lock:
+            self._latest = None
+            self._in_use = None
+            self._buffers = [None] * _RING_SIZE
+    
+    def _capture_loop(self):
+        """Read frames into the latest-frame slot until stopped (runs on the capture thread)"""
+        capture = self.capture
+        buffers = self._buffers
+        while self.is_running:
+            try:
+                # Advance the stream at camera rate, but only decode a frame once the consumer
+                # has taken the previous one; frames it would never see are skipped undecoded
+                ret = capture.grab()
+                frame = None
+                if ret:
+                    self.frames_grabbed += 1
+                    with self._lock:
+                        if self._latest is not None:
+                            self.frames_skipped += 1
+                            continue
+                        index = next(i for i in range(_RING_SIZE) if i != self._in_use)
+                    # Decodes into the buffer in place (reallocated only if the frame size changed)
+                    ret, frame = capture.retrieve(buffers[index])
+                    if ret:
+                        self.frames_decoded += 1
+            except Exception as e:
+                # Handle camera errors (disconnection, etc.)
+                _log.warning("Camera error: %s", e)
+                self._end_capture()
+                return
+            
+            if not ret or frame is None:
+                # Camera may have disconnected - check if still opened
+                if not capture.isOpened():
+                    self._end_capture()
+                    return
+                time.sleep(0.005)
+                continue
+            
+            buffers[index] = frame
+            with self._lock:
+                self._latest = index
+                self._frame_ready.notify()
+    
+    def _end_capture(self):
+        """Mark capture as stopped from the capture thread and wake any waiting consumer"""
+        with self._lock:
+            self.is_running = False
+            self._frame_ready.notify_all()
     
     def get_frame(self) -> Optional[np.ndarray]:
         """
-        Capture a single frame from the camera.
+        Get the frame decoded by the capture thread.
+        
+        Each frame is returned once. While a frame is waiting to be taken, newer camera frames
+        are skipped without being decoded. The array is a reused capture buffer: it stays
+        valid until the next get_frame()/wait_frame() call, so copy it to keep it longer.
         
         Returns:
-            BGR image as numpy array, or None if capture failed
+            BGR image as numpy array, or None if no new frame is available
+            (check is_running to tell a stopped/disconnected camera apart)
         """
-        if not self.is_running or self.capture is None:
+        with self._lock:
+            return self._take_latest()
+    
+    def _take_latest(self) -> Optional[np.ndarray]:
+        """Hand out the unread frame, if any, releasing the previously handed out one (lock held)"""
+        if self._latest is None:
             return None
+        self._in_use = self._latest
+        self._latest = None
+        return self._buffers[self._in_use]
+    
+    def wait_frame(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Block until the capture thread has a new frame, then take it.
         
-        try:
-            ret, frame = self.capture.read()
-            
-            if not ret or frame is None:
-                # Camera may have disconnected - check if still opened
-                if not self.capture.isOpened():
-                    self.is_running = False
-                    self.capture = None
-                return None
+        Like get_frame(), each frame is returned once and the array stays valid until the
+        next get_frame()/wait_frame() call.
+        
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
             
-            return frame
-        except Exception as e:
-            # Handle camera errors (disconnection, etc.)
-            print(f"Warning: Camera error: {e}")
-            self.is_running = False
-            if self.capture is not None:
-                try:
-                    self.capture.release()
-                except:
-                    pass
-                self.capture = None
-            return None
+        Returns:
+            BGR image as numpy array, or None on timeout or once capture has stopped
+            (check is_running to tell the two apart)
+        """
+        with self._lock:
+            self._frame_ready.wait_for(lambda: self._latest is not None or not self.is_running, timeout)
+            return self._take_latest()
     
     def get_frame_size(self) -> Optional[Tuple[int, int]]:
         """
@@ -2,10 +2,23 @@
 
 import os
 import yaml
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from src.config.profile_schema import Profile, GestureConfig, TriggerConfig, ActionConfig
 
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+class _ProfileDumper(_Dumper):
+    """Dumper for plain profile dicts: no anchor/alias bookkeeping per represented object"""
+    
+    def ignore_aliases(self, data):
+        return True
+
 
 class ProfileManager:
     """Manages loading and saving of profiles"""
@@ -20,6 +33,9 @@ class ProfileManager:
         self.profiles_dir = Path(profiles_dir)
         self.profiles_dir.mkdir(exist_ok=True)
         
+        # Parsed profiles keyed by path, valid while (mtime_ns, size) match the file
+        self._cache: Dict[str, Tuple[int, int, Profile]] = {}
+        
     def load_profile(self, filepath: str) -> Optional[Profile]:
         """
         Load a profile from a YAML file.
@@ -28,15 +44,24 @@ class ProfileManager:
             filepath: Path to the profile file
             
         Returns:
-            Profile object, or None if loading failed
+            Profile object (shared with the cache, do not modify), or None if loading failed
         """
         try:
             if not os.path.exists(filepath):
                 print(f"Error: Profile file not found: {filepath}")
                 return None
             
+            # Reuse the parsed profile if the file is unchanged. The same object is
+            # returned on every hit, so treat loaded profiles as read-only and copy
+            # before editing.
+            key = os.path.abspath(filepath)
+            st = os.stat(filepath)
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            
             with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_Loader)
             
             if data is None:
                 print(f"Error: Profile file is empty or invalid: {filepath}")
@@ -51,6 +76,7 @@ class ProfileManager:
                 print(f"Warning: Profile validation failed: {error_msg}")
                 # Still return profile but warn user
             
+            self._cache[key] = (st.st_mtime_ns, st.st_size, profile)
             return profile
             
         except yaml.YAMLError as e:
@@ -74,6 +100,8 @@ class ProfileManager:
             True if saved successfully, False otherwise
         """
         try:
+            self._cache.pop(os.path.abspath(filepath), None)
+            
             # Ensure directory exists
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             
@@ -85,7 +113,7 @@ class ProfileManager:
             # Convert to dict and save
             data = profile.to_dict()
             with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                yaml.dump(data, f, Dumper=_ProfileDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
             
             return True
             
@@ -133,6 +161,7 @@ class ProfileManager:
         Returns:
             True if deleted successfully, False otherwise
         """
+        self._cache.pop(os.path.abspath(filepath), None)
         try:
             Path(filepath).unlink()
             return True
@@ -1,55 +1,166 @@
-"""Pydantic models for profile configuration and validation"""
+"""Dataclass models for profile configuration and validation"""
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, FrozenSet
 
+_MISSING = object()
 
-class TriggerConfig(BaseModel):
+
+def _get_field(data: Dict[str, Any], key: str, expected: type, owner: str, default: Any = _MISSING) -> Any:
+    """
+    Read and type-check a field from a raw configuration dictionary.
+    
+    Args:
+        data: Raw configuration dictionary
+        key: Field name
+        expected: Required type of the value
+        owner: Name of the containing model (for error messages)
+        default: Value used when the field is absent; required if not given
+        
+    Returns:
+        Field value
+        
+    Raises:
+        ValueError: If the field is missing or has the wrong type
+    """
+    if key not in data:
+        if default is _MISSING:
+            raise ValueError(f"{owner}: missing required field '{key}'")
+        return default
+    
+    value = data[key]
+    if not isinstance(value, expected):
+        raise ValueError(f"{owner}: field '{key}' must be {expected.__name__}, got {type(value).__name__}")
+    return value
+
+
+def _get_extra(data: Dict[str, Any], known: FrozenSet[str]) -> Dict[str, Any]:
+    """Collect unknown keys so they survive a load/save round-trip"""
+    # Common case: no unknown keys (single C-level subset check, no per-key loop)
+    if data.keys() <= known:
+        return {}
+    return {key: value for key, value in data.items() if key not in known}
+
+
+def _check_dict(data: Any, owner: str) -> Dict[str, Any]:
+    """Ensure a raw configuration value is a dictionary"""
+    if not isinstance(data, dict):
+        raise ValueError(f"{owner}: expected a mapping, got {type(data).__name__}")
+    return data
+
+
+@dataclass
+class TriggerConfig:
     """Configuration for a trigger"""
-    type: str = Field(..., description="Type of trigger (e.g., 'hand_raise', 'body_lean')")
-    params: Dict[str, Any] = Field(default_factory=dict, description="Trigger-specific parameters")
+    type: str  # Type of trigger (e.g., 'hand_raise', 'body_lean')
+    params: Dict[str, Any] = field(default_factory=dict)  # Trigger-specific parameters
+    extra: Dict[str, Any] = field(default_factory=dict, repr=False)  # Unknown keys, kept as-is
+    
+    _FIELDS = frozenset(("type", "params"))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert trigger configuration to dictionary"""
+        return {"type": self.type, "params": dict(self.params), **self.extra}
     
-    class Config:
-        extra = "allow"
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TriggerConfig":
+        """Create trigger configuration from dictionary"""
+        _check_dict(data, "TriggerConfig")
+        return cls(
+            type=_get_field(data, "type", str, "TriggerConfig"),
+            params=_get_field(data, "params", dict, "TriggerConfig", {}),
+            extra=_get_extra(data, cls._FIELDS)
+        )
 
 
-class ActionConfig(BaseModel):
+@dataclass
+class ActionConfig:
     """Configuration for an action"""
-    type: str = Field(..., description="Type of action (e.g., 'keyboard', 'mouse', 'gamepad')")
-    params: Dict[str, Any] = Field(default_factory=dict, description="Action-specific parameters")
+    type: str  # Type of action (e.g., 'keyboard', 'mouse', 'gamepad')
+    params: Dict[str, Any] = field(default_factory=dict)  # Action-specific parameters
+    extra: Dict[str, Any] = field(default_factory=dict, repr=False)  # Unknown keys, kept as-is
+    
+    _FIELDS = frozenset(("type", "params"))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert action configuration to dictionary"""
+        return {"type": self.type, "params": dict(self.params), **self.extra}
     
-    class Config:
-        extra = "allow"
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ActionConfig":
+        """Create action configuration from dictionary"""
+        _check_dict(data, "ActionConfig")
+        return cls(
+            type=_get_field(data, "type", str, "ActionConfig"),
+            params=_get_field(data, "params", dict, "ActionConfig", {}),
+            extra=_get_extra(data, cls._FIELDS)
+        )
 
 
-class GestureConfig(BaseModel):
+@dataclass
+class GestureConfig:
     """Configuration for a gesture (trigger + action pair)"""
-    name: str = Field(..., description="Human-readable name for the gesture")
-    trigger: TriggerConfig = Field(..., description="Trigger configuration")
-    action: ActionConfig = Field(..., description="Action configuration")
-    enabled: bool = Field(default=True, description="Whether this gesture is enabled")
+    name: str  # Human-readable name for the gesture
+    trigger: TriggerConfig  # Trigger configuration
+    action: ActionConfig  # Action configuration
+    enabled: bool = True  # Whether this gesture is enabled
+    extra: Dict[str, Any] = field(default_factory=dict, repr=False)  # Unknown keys, kept as-is
+    
+    _FIELDS = frozenset(("name", "trigger", "action", "enabled"))
     
-    class Config:
-        extra = "allow"
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert gesture configuration to dictionary"""
+        return {
+            "name": self.name,
+            "trigger": self.trigger.to_dict(),
+            "action": self.action.to_dict(),
+            "enabled": self.enabled,
+            **self.extra
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GestureConfig":
+        """Create gesture configuration from dictionary"""
+        _check_dict(data, "GestureConfig")
+        return cls(
+            name=_get_field(data, "name", str, "GestureConfig"),
+            trigger=TriggerConfig.from_dict(_get_field(data, "trigger", dict, "GestureConfig")),
+            action=ActionConfig.from_dict(_get_field(data, "action", dict, "GestureConfig")),
+            enabled=_get_field(data, "enabled", bool, "GestureConfig", True),
+            extra=_get_extra(data, cls._FIELDS)
+        )
 
 
-class Profile(BaseModel):
+@dataclass
+class Profile:
     """Complete profile configuration"""
-    name: str = Field(..., description="Profile name")
-    description: str = Field(default="", description="Profile description")
-    game: str = Field(default="", description="Target game or application")
-    gestures: List[GestureConfig] = Field(default_factory=list, description="List of gestures")
+    name: str  # Profile name
+    description: str = ""  # Profile description
+    game: str = ""  # Target game or application
+    gestures: List[GestureConfig] = field(default_factory=list)  # List of gestures
+    extra: Dict[str, Any] = field(default_factory=dict, repr=False)  # Unknown keys, kept as-is
     
-    class Config:
-        extra = "allow"
+    _FIELDS = frozenset(("name", "description", "game", "gestures"))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary"""
-        return self.model_dump()
+        return {
+            "name": self.name,
+            "description": self.description,
+            "game": self.game,
+            "gestures": [gesture.to_dict() for gesture in self.gestures],
+            **self.extra
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Profile":
         """Create profile from dictionary"""
-        return cls(**data)
-
-
+        _check_dict(data, "Profile")
+        gestures = _get_field(data, "gestures", list, "Profile", [])
+        return cls(
+            name=_get_field(data, "name", str, "Profile"),
+            description=_get_field(data, "description", str, "Profile", ""),
+            game=_get_field(data, "game", str, "Profile", ""),
+            gestures=[GestureConfig.from_dict(gesture) for gesture in gestures],
+            extra=_get_extra(data, cls._FIELDS)
+        )
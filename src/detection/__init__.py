@@ -1,23 +1,35 @@
 """Pose and hand detection module using MediaPipe"""
 
-from src.detection.pose_detector import PoseDetector
-from src.detection.hand_detector import HandDetector, is_hand_open, get_hand_landmark_position
-from src.detection.landmark_utils import (
-    get_landmark_position,
-    calculate_angle,
-    calculate_distance,
-    normalize_by_torso_height
-)
+import importlib
 
-__all__ = [
-    "PoseDetector",
-    "HandDetector",
-    "is_hand_open",
-    "get_hand_landmark_position",
-    "get_landmark_position",
-    "calculate_angle",
-    "calculate_distance",
-    "normalize_by_torso_height"
-]
+# Public names and the submodule defining each. Submodules (and MediaPipe with them)
+# are imported on first attribute access (PEP 562), so importing this package is cheap.
+_EXPORTS = {
+    "PoseDetector": "src.detection.pose_detector",
+    "pose_landmarks_to_array": "src.detection.pose_detector",
+    "HandDetector": "src.detection.hand_detector",
+    "is_hand_open": "src.detection.hand_detector",
+    "count_extended_fingers": "src.detection.hand_detector",
+    "get_hand_landmark_position": "src.detection.hand_detector",
+    "hand_landmarks_to_array": "src.detection.hand_detector",
+    "get_landmark_position": "src.detection.landmark_utils",
+    "calculate_angle": "src.detection.landmark_utils",
+    "calculate_distance": "src.detection.landmark_utils",
+    "normalize_by_torso_height": "src.detection.landmark_utils",
+    "get_body_center": "src.detection.landmark_utils"
+}
 
+__all__ = list(_EXPORTS)
 
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
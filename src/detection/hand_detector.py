@@ -6,8 +6,14 @@ import numpy as np
 from typing import Optional, Tuple, Dict, Any
 from src.utils.constants import (
     DEFAULT_MIN_DETECTION_CONFIDENCE,
-    DEFAULT_MIN_TRACKING_CONFIDENCE
+    DEFAULT_MIN_TRACKING_CONFIDENCE,
+    DEFAULT_HAND_INFERENCE_WIDTH
 )
+from src.utils.image_utils import compute_inference_size
+
+# Index, middle, ring and pinky tip / PIP landmark rows (thumb is checked separately)
+_FINGER_TIPS = np.array([8, 12, 16, 20], dtype=np.intp)
+_FINGER_PIPS = np.array([6, 10, 14, 18], dtype=np.intp)
 
 
 class HandDetector:
@@ -17,7 +23,9 @@ class HandDetector:
                  static_image_mode: bool = False,
                  max_num_hands: int = 2,
                  min_detection_confidence: float = DEFAULT_MIN_DETECTION_CONFIDENCE,
-                 min_tracking_confidence: float = DEFAULT_MIN_TRACKING_CONFIDENCE):
+                 min_tracking_confidence: float = DEFAULT_MIN_TRACKING_CONFIDENCE,
+                 inference_width: Optional[int] = DEFAULT_HAND_INFERENCE_WIDTH,
+                 frame_is_rgb: bool = False):
         """
         Initialize MediaPipe Hands detector.
         
@@ -26,10 +34,19 @@ class HandDetector:
             max_num_hands: Maximum number of hands to detect (1 or 2)
             min_detection_confidence: Minimum confidence for hand detection
             min_tracking_confidence: Minimum confidence for hand tracking
+            inference_width: Downscale wider frames to this width (keeping aspect ratio)
+                before detection, or None to use full resolution. Landmarks are normalized,
+                so results need no rescaling.
+            frame_is_rgb: detect() receives RGB frames and skips the BGR to RGB conversion
+                (the caller should mark them read-only to avoid a copy inside MediaPipe).
+                The app does this; BGR input is converted per call for standalone use.
         """
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
+        # Built once: the style getters construct a fresh DrawingSpec per landmark on every call
+        self._landmark_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+        self._connection_style = self.mp_drawing_styles.get_default_hand_connections_style()
         
         self.hands = self.mp_hands.Hands(
             static_image_mode=static_image_mode,
@@ -37,27 +54,42 @@ class HandDetector:
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
         )
+        
+        self.frame_is_rgb = frame_is_rgb
+        self.inference_width = inference_width
+        self._inference_size: Optional[Tuple[int, int]] = None  # (width, height) for the last frame shape
+        self._inference_src_shape: Optional[Tuple[int, ...]] = None
     
     def detect(self, frame: np.ndarray) -> Optional[Dict[str, Any]]:
         """
         Detect hands in a frame.
         
         Args:
-            frame: BGR image from OpenCV
+            frame: BGR image from OpenCV (RGB if constructed with frame_is_rgb)
             
         Returns:
             Dictionary with 'left' and 'right' keys containing hand landmarks,
             or None if no hands detected. Each hand contains:
             - landmarks: MediaPipe hand landmarks (21 points)
+            - array: (21, 3) float32 landmark coordinates (see hand_landmarks_to_array)
             - handedness: 'Left' or 'Right' (from camera perspective)
         """
         if frame is None:
             return None
         
+        # MediaPipe resizes internally anyway; shrinking first cuts conversion and preprocessing work
+        if frame.shape != self._inference_src_shape:
+            self._inference_src_shape = frame.shape
+            self._inference_size = compute_inference_size(frame.shape[1], frame.shape[0], self.inference_width)
+        if self._inference_size is not None:
+            frame = cv2.resize(frame, self._inference_size, interpolation=cv2.INTER_AREA)
+        
         # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb_frame = frame if self.frame_is_rgb else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
-        # Process the frame
+        # Process the frame (read-only input lets MediaPipe reference it instead of copying)
+        if rgb_frame.flags.writeable:
+            rgb_frame.flags.writeable = False
         results = self.hands.process(rgb_frame)
         
         if not results.multi_hand_landmarks:
@@ -78,6 +110,7 @@ class HandDetector:
             hand_key = handedness.lower()
             hands_dict[hand_key] = {
                 'landmarks': hand_landmarks,
+                'array': hand_landmarks_to_array(hand_landmarks),  # (21, 3) for trigger math
                 'handedness': handedness
             }
         
@@ -86,7 +119,8 @@ class HandDetector:
     def draw_landmarks(self,
                       frame: np.ndarray,
                       hands: Optional[Dict[str, any]],
-                      draw_connections: bool = True) -> np.ndarray:
+                      draw_connections: bool = True,
+                      inplace: bool = False) -> np.ndarray:
         """
         Draw hand landmarks on frame.
         
@@ -94,6 +128,7 @@ class HandDetector:
             frame: BGR image from OpenCV
             hands: Hands dictionary from detect()
             draw_connections: Whether to draw hand skeleton connections
+            inplace: Draw directly onto frame instead of a copy
             
         Returns:
             Frame with hand landmarks drawn
@@ -101,8 +136,8 @@ class HandDetector:
         if hands is None:
             return frame
         
-        # Create a copy to avoid modifying original
-        annotated_frame = frame.copy()
+        # Create a copy to avoid modifying original, unless the caller owns the frame
+        annotated_frame = frame if inplace else frame.copy()
         
         # Draw each hand
         for hand_data in hands.values():
@@ -113,15 +148,15 @@ class HandDetector:
                     annotated_frame,
                     hand_landmarks,
                     self.mp_hands.HAND_CONNECTIONS,
-                    landmark_drawing_spec=self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    connection_drawing_spec=self.mp_drawing_styles.get_default_hand_connections_style()
+                    landmark_drawing_spec=self._landmark_style,
+                    connection_drawing_spec=self._connection_style
                 )
             else:
                 self.mp_drawing.draw_landmarks(
                     annotated_frame,
                     hand_landmarks,
                     None,
-                    landmark_drawing_spec=self.mp_drawing_styles.get_default_hand_landmarks_style()
+                    landmark_drawing_spec=self._landmark_style
                 )
         
         return annotated_frame
@@ -138,57 +173,84 @@ class HandDetector:
             pass
 
 
-def is_hand_open(hand_landmarks: object) -> bool:
+def hand_landmarks_to_array(hand_landmarks: object) -> np.ndarray:
     """
-    Determine if a hand is open (fingers extended) or closed (fist).
-    
-    Algorithm: Check if fingertips are extended beyond their respective PIP joints.
-    For each finger (thumb, index, middle, ring, pinky):
-    - If fingertip is above PIP joint (lower Y value), finger is extended
-    - If 3+ fingers are extended, hand is considered open
+    Copy hand landmark coordinates into a single array.
     
     Args:
         hand_landmarks: MediaPipe hand landmarks (21 points)
         
     Returns:
-        True if hand is open, False if closed (fist)
+        (N, 3) float32 array of normalized (x, y, z) per landmark
     """
-    if hand_landmarks is None:
-        return False
+    landmarks = hand_landmarks.landmark
+    return np.fromiter(
+        (value for lm in landmarks for value in (lm.x, lm.y, lm.z)),
+        dtype=np.float32,
+        count=len(landmarks) * 3
+    ).reshape(-1, 3)
+
+
+def _as_hand_array(hand_landmarks: object) -> np.ndarray:
+    """Return landmarks as a (21, 3) array, converting MediaPipe landmarks if needed"""
+    if isinstance(hand_landmarks, np.ndarray):
+        return hand_landmarks
+    return hand_landmarks_to_array(hand_landmarks)
+
+
+def count_extended_fingers(hand_landmarks: object) -> int:
+    """
+    Count extended fingers (0-5).
     
+    Algorithm: Check if fingertips are extended beyond their respective PIP joints.
+    - Index to pinky: extended if fingertip is above PIP joint (lower Y value)
+    - Thumb: extended if tip X is further from wrist than IP X
+    
+    Args:
+        hand_landmarks: MediaPipe hand landmarks, or (21, 3) array from hand_landmarks_to_array()
+        
+    Returns:
+        Number of extended fingers
+    """
     # MediaPipe hand landmark indices
     # Thumb: 4 (tip), 3 (IP), 2 (MCP)
     # Index: 8 (tip), 6 (PIP), 5 (MCP)
     # Middle: 12 (tip), 10 (PIP), 9 (MCP)
     # Ring: 16 (tip), 14 (PIP), 13 (MCP)
     # Pinky: 20 (tip), 18 (PIP), 17 (MCP)
+    points = _as_hand_array(hand_landmarks)
     
-    extended_fingers = 0
-    
-    # Check each finger (except thumb - different logic)
-    finger_tips = [8, 12, 16, 20]  # Index, Middle, Ring, Pinky
-    finger_pips = [6, 10, 14, 18]  # Corresponding PIP joints
-    
-    for tip_idx, pip_idx in zip(finger_tips, finger_pips):
-        tip = hand_landmarks.landmark[tip_idx]
-        pip = hand_landmarks.landmark[pip_idx]
-        
-        # Finger is extended if tip Y is above PIP Y (lower value = higher on screen)
-        if tip.y < pip.y:
-            extended_fingers += 1
+    # Finger is extended if tip Y is above PIP Y (lower value = higher on screen)
+    # Index, Middle, Ring, Pinky (thumb uses different logic)
+    extended_fingers = int(np.count_nonzero(points[_FINGER_TIPS, 1] < points[_FINGER_PIPS, 1]))
     
     # Check thumb separately (compares X position instead of Y)
-    thumb_tip = hand_landmarks.landmark[4]
-    thumb_ip = hand_landmarks.landmark[3]
     # Thumb is extended if tip X is further from wrist than IP X
     # (depends on which hand, but this works for both)
-    thumb_extended = abs(thumb_tip.x - hand_landmarks.landmark[0].x) > abs(thumb_ip.x - hand_landmarks.landmark[0].x)
-    
-    if thumb_extended:
+    wrist_x = points[0, 0]
+    if abs(points[4, 0] - wrist_x) > abs(points[3, 0] - wrist_x):
         extended_fingers += 1
     
+    return extended_fingers
+
+
+def is_hand_open(hand_landmarks: object) -> bool:
+    """
+    Determine if a hand is open (fingers extended) or closed (fist).
+    
+    A hand is considered open if 3+ fingers are extended (see count_extended_fingers).
+    
+    Args:
+        hand_landmarks: MediaPipe hand landmarks, or (21, 3) array from hand_landmarks_to_array()
+        
+    Returns:
+        True if hand is open, False if closed (fist)
+    """
+    if hand_landmarks is None:
+        return False
+    
     # Hand is open if 3 or more fingers are extended
-    return extended_fingers >= 3
+    return count_extended_fingers(hand_landmarks) >= 3
 
 
 def get_hand_landmark_position(hand_landmarks: object, landmark_id: int) -> Optional[Tuple[float, float, float]]:
@@ -196,7 +258,7 @@ def get_hand_landmark_position(hand_landmarks: object, landmark_id: int) -> Opti
     Get the position of a specific hand landmark.
     
     Args:
-        hand_landmarks: MediaPipe hand landmarks object
+        hand_landmarks: MediaPipe hand landmarks object, or (21, 3) array from hand_landmarks_to_array()
         landmark_id: Index of the landmark (0-20)
         
     Returns:
@@ -205,9 +267,14 @@ def get_hand_landmark_position(hand_landmarks: object, landmark_id: int) -> Opti
     if hand_landmarks is None:
         return None
     
-    try:
-        landmark = hand_landmarks.landmark[landmark_id]
+    if isinstance(hand_landmarks, np.ndarray):
+        if not 0 <= landmark_id < len(hand_landmarks):
+            return None
+        return tuple(hand_landmarks[landmark_id].tolist())
+    
+    points = hand_landmarks.landmark
+    if 0 <= landmark_id < len(points):
+        landmark = points[landmark_id]
         return (landmark.x, landmark.y, landmark.z)
-    except (IndexError, AttributeError):
-        return None
+    return None
 
@@ -1,7 +1,8 @@
 """Utility functions for working with MediaPipe hand landmarks"""
 
+import numpy as np
 from typing import Tuple, Optional
-from src.detection.hand_detector import get_hand_landmark_position
+from src.detection.hand_detector import hand_landmarks_to_array
 
 
 # MediaPipe hand landmark indices
@@ -30,12 +31,39 @@ class HandLandmarkIndex:
     PINKY_TIP = 20
 
 
+# Module-level aliases for indices used on the per-frame path (avoid class attribute lookups)
+WRIST = HandLandmarkIndex.WRIST
+THUMB_MCP = HandLandmarkIndex.THUMB_MCP
+THUMB_IP = HandLandmarkIndex.THUMB_IP
+THUMB_TIP = HandLandmarkIndex.THUMB_TIP
+INDEX_MCP = HandLandmarkIndex.INDEX_MCP
+INDEX_PIP = HandLandmarkIndex.INDEX_PIP
+INDEX_TIP = HandLandmarkIndex.INDEX_TIP
+MIDDLE_MCP = HandLandmarkIndex.MIDDLE_MCP
+MIDDLE_PIP = HandLandmarkIndex.MIDDLE_PIP
+MIDDLE_TIP = HandLandmarkIndex.MIDDLE_TIP
+RING_MCP = HandLandmarkIndex.RING_MCP
+RING_PIP = HandLandmarkIndex.RING_PIP
+RING_TIP = HandLandmarkIndex.RING_TIP
+PINKY_MCP = HandLandmarkIndex.PINKY_MCP
+PINKY_PIP = HandLandmarkIndex.PINKY_PIP
+PINKY_TIP = HandLandmarkIndex.PINKY_TIP
+
+# (tip, PIP, MCP) landmark indices for each non-thumb finger
+_FINGER_LANDMARKS = {
+    "index": (INDEX_TIP, INDEX_PIP, INDEX_MCP),
+    "middle": (MIDDLE_TIP, MIDDLE_PIP, MIDDLE_MCP),
+    "ring": (RING_TIP, RING_PIP, RING_MCP),
+    "pinky": (PINKY_TIP, PINKY_PIP, PINKY_MCP),
+}
+
+
 def calculate_finger_extension(hand_landmarks: object, finger: str) -> Optional[float]:
     """
     Calculate how extended a finger is (0.0 = fully closed, 1.0 = fully extended).
     
     Args:
-        hand_landmarks: MediaPipe hand landmarks
+        hand_landmarks: MediaPipe hand landmarks, or (21, 3) array from hand_landmarks_to_array()
         finger: "thumb", "index", "middle", "ring", or "pinky"
         
     Returns:
@@ -47,63 +75,49 @@ def calculate_finger_extension(hand_landmarks: object, finger: str) -> Optional[
     finger = finger.lower()
     
     try:
+        # Fetch all landmarks in one shot, then work on scalars
+        if isinstance(hand_landmarks, np.ndarray):
+            points = hand_landmarks
+        else:
+            points = hand_landmarks_to_array(hand_landmarks)
+        
         if finger == "thumb":
-            tip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.THUMB_TIP)
-            ip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.THUMB_IP)
-            mcp = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.THUMB_MCP)
-            wrist = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.WRIST)
-            
-            if None in [tip, ip, mcp, wrist]:
-                return None
+            tip_x, tip_y = points[THUMB_TIP, 0], points[THUMB_TIP, 1]
+            ip_x, ip_y = points[THUMB_IP, 0], points[THUMB_IP, 1]
+            wrist_x, wrist_y = points[WRIST, 0], points[WRIST, 1]
             
             # For thumb, measure distance from wrist
-            tip_dist = abs(tip[0] - wrist[0]) + abs(tip[1] - wrist[1])
-            ip_dist = abs(ip[0] - wrist[0]) + abs(ip[1] - wrist[1])
+            tip_dist = abs(tip_x - wrist_x) + abs(tip_y - wrist_y)
+            ip_dist = abs(ip_x - wrist_x) + abs(ip_y - wrist_y)
             
             if ip_dist == 0:
                 return 0.0
             
-            extension = min(1.0, tip_dist / ip_dist)
+            extension = min(1.0, float(tip_dist / ip_dist))
             return extension
-            
-        elif finger == "index":
-            tip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.INDEX_TIP)
-            pip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.INDEX_PIP)
-            mcp = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.INDEX_MCP)
-        elif finger == "middle":
-            tip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.MIDDLE_TIP)
-            pip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.MIDDLE_PIP)
-            mcp = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.MIDDLE_MCP)
-        elif finger == "ring":
-            tip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.RING_TIP)
-            pip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.RING_PIP)
-            mcp = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.RING_MCP)
-        elif finger == "pinky":
-            tip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.PINKY_TIP)
-            pip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.PINKY_PIP)
-            mcp = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.PINKY_MCP)
-        else:
-            return None
         
-        if None in [tip, pip, mcp]:
+        finger_landmarks = _FINGER_LANDMARKS.get(finger)
+        if finger_landmarks is None:
             return None
         
+        tip_idx, pip_idx, mcp_idx = finger_landmarks
+        tip_y = points[tip_idx, 1]
+        pip_y = points[pip_idx, 1]
+        mcp_y = points[mcp_idx, 1]
+        
         # For other fingers, measure Y distance (tip above PIP = extended)
         # Calculate extension based on how far tip is above PIP
-        y_diff = pip[1] - tip[1]  # Positive = tip above PIP = extended
+        y_diff = pip_y - tip_y  # Positive = tip above PIP = extended
         
         # Normalize: assume fully extended is when tip is significantly above PIP
         # Use MCP-PIP distance as reference
-        mcp_pip_dist = abs(pip[1] - mcp[1])
+        mcp_pip_dist = abs(pip_y - mcp_y)
         
         if mcp_pip_dist == 0:
             return 0.0
         
-        extension = max(0.0, min(1.0, y_diff / mcp_pip_dist))
+        extension = max(0.0, min(1.0, float(y_diff / mcp_pip_dist)))
         return extension
         
     except Exception:
         return None
-
-
-
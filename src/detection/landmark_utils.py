@@ -1,7 +1,8 @@
 """Utility functions for working with MediaPipe landmarks"""
 
-import mediapipe as mp
+import numpy as np
 from typing import Tuple, Optional
+from src.detection.pose_detector import pose_landmarks_to_array
 from src.utils.math_utils import calculate_angle_2d, calculate_distance_2d, calculate_distance_3d
 
 
@@ -43,12 +44,22 @@ class LandmarkIndex:
     RIGHT_FOOT_INDEX = 32
 
 
+# Module-level aliases for indices used on the per-frame path (avoid class attribute lookups)
+LEFT_SHOULDER = LandmarkIndex.LEFT_SHOULDER
+RIGHT_SHOULDER = LandmarkIndex.RIGHT_SHOULDER
+LEFT_HIP = LandmarkIndex.LEFT_HIP
+RIGHT_HIP = LandmarkIndex.RIGHT_HIP
+
+# Rows averaged for the body center
+_TORSO_LANDMARKS = [LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP]
+
+
 def get_landmark_position(landmarks: object, landmark_id: int) -> Optional[Tuple[float, float, float]]:
     """
     Get the position of a specific landmark.
     
     Args:
-        landmarks: MediaPipe pose landmarks object
+        landmarks: MediaPipe pose landmarks object, or (33, 4) array from pose_landmarks_to_array()
         landmark_id: Index of the landmark
         
     Returns:
@@ -57,11 +68,17 @@ def get_landmark_position(landmarks: object, landmark_id: int) -> Optional[Tuple
     if landmarks is None:
         return None
     
-    try:
-        landmark = landmarks.landmark[landmark_id]
-        return (landmark.x, landmark.y, landmark.z)
-    except (IndexError, AttributeError):
+    if isinstance(landmarks, np.ndarray):
+        if 0 <= landmark_id < len(landmarks):
+            x, y, z = landmarks[landmark_id, :3].tolist()
+            return (x, y, z)
         return None
+    
+    points = landmarks.landmark
+    if 0 <= landmark_id < len(points):
+        landmark = points[landmark_id]
+        return (landmark.x, landmark.y, landmark.z)
+    return None
 
 
 def get_landmark_visibility(landmarks: object, landmark_id: int) -> Optional[float]:
@@ -69,7 +86,7 @@ def get_landmark_visibility(landmarks: object, landmark_id: int) -> Optional[flo
     Get the visibility score of a specific landmark.
     
     Args:
-        landmarks: MediaPipe pose landmarks object
+        landmarks: MediaPipe pose landmarks object, or (33, 4) array from pose_landmarks_to_array()
         landmark_id: Index of the landmark
         
     Returns:
@@ -78,11 +95,15 @@ def get_landmark_visibility(landmarks: object, landmark_id: int) -> Optional[flo
     if landmarks is None:
         return None
     
-    try:
-        landmark = landmarks.landmark[landmark_id]
-        return landmark.visibility
-    except (IndexError, AttributeError):
+    if isinstance(landmarks, np.ndarray):
+        if 0 <= landmark_id < len(landmarks):
+            return float(landmarks[landmark_id, 3])
         return None
+    
+    points = landmarks.landmark
+    if 0 <= landmark_id < len(points):
+        return points[landmark_id].visibility
+    return None
 
 
 def calculate_angle(landmarks: object, 
@@ -157,12 +178,12 @@ def normalize_by_torso_height(landmarks: object,
         Normalized point, or None if torso not detected
     """
     # Calculate average torso height
-    left_shoulder = get_landmark_position(landmarks, LandmarkIndex.LEFT_SHOULDER)
-    right_shoulder = get_landmark_position(landmarks, LandmarkIndex.RIGHT_SHOULDER)
-    left_hip = get_landmark_position(landmarks, LandmarkIndex.LEFT_HIP)
-    right_hip = get_landmark_position(landmarks, LandmarkIndex.RIGHT_HIP)
+    left_shoulder = get_landmark_position(landmarks, LEFT_SHOULDER)
+    right_shoulder = get_landmark_position(landmarks, RIGHT_SHOULDER)
+    left_hip = get_landmark_position(landmarks, LEFT_HIP)
+    right_hip = get_landmark_position(landmarks, RIGHT_HIP)
     
-    if None in [left_shoulder, right_shoulder, left_hip, right_hip]:
+    if left_shoulder is None or right_shoulder is None or left_hip is None or right_hip is None:
         return None
     
     # Calculate midpoints
@@ -183,22 +204,22 @@ def get_body_center(landmarks: object) -> Optional[Tuple[float, float]]:
     Get the center point of the body (midpoint of shoulders and hips).
     
     Args:
-        landmarks: MediaPipe pose landmarks object
+        landmarks: MediaPipe pose landmarks object, or (33, 4) array from pose_landmarks_to_array()
         
     Returns:
         (x, y) coordinates of body center, or None if not detected
     """
-    left_shoulder = get_landmark_position(landmarks, LandmarkIndex.LEFT_SHOULDER)
-    right_shoulder = get_landmark_position(landmarks, LandmarkIndex.RIGHT_SHOULDER)
-    left_hip = get_landmark_position(landmarks, LandmarkIndex.LEFT_HIP)
-    right_hip = get_landmark_position(landmarks, LandmarkIndex.RIGHT_HIP)
-    
-    if None in [left_shoulder, right_shoulder, left_hip, right_hip]:
+    if landmarks is None:
         return None
     
-    center_x = (left_shoulder[0] + right_shoulder[0] + left_hip[0] + right_hip[0]) / 4
-    center_y = (left_shoulder[1] + right_shoulder[1] + left_hip[1] + right_hip[1]) / 4
+    if not isinstance(landmarks, np.ndarray):
+        try:
+            landmarks = pose_landmarks_to_array(landmarks)
+        except AttributeError:
+            return None
     
+    if len(landmarks) <= RIGHT_HIP:
+        return None
+    
+    center_x, center_y = landmarks[_TORSO_LANDMARKS, :2].mean(axis=0).tolist()
     return (center_x, center_y)
-
-
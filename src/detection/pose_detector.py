@@ -3,12 +3,22 @@
 import cv2
 import mediapipe as mp
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 from src.utils.constants import (
     DEFAULT_MODEL_COMPLEXITY,
     DEFAULT_MIN_DETECTION_CONFIDENCE,
-    DEFAULT_MIN_TRACKING_CONFIDENCE
+    DEFAULT_MIN_TRACKING_CONFIDENCE,
+    DEFAULT_POSE_INFERENCE_WIDTH
 )
+from src.utils.image_utils import compute_inference_size
+from src.detection.pose_kernels import project_and_filter
+
+# Matches mediapipe.solutions.drawing_utils: landmarks below this visibility are not drawn,
+# connections are white (224, 224, 224) with thickness 2, joints get a white border ring
+_VISIBILITY_THRESHOLD = 0.5
+_CONNECTION_COLOR = (224, 224, 224)
+_CONNECTION_THICKNESS = 2
+_BORDER_COLOR = (224, 224, 224)
 
 
 class PoseDetector:
@@ -19,7 +29,9 @@ class PoseDetector:
                  model_complexity: int = DEFAULT_MODEL_COMPLEXITY,
                  smooth_landmarks: bool = True,
                  min_detection_confidence: float = DEFAULT_MIN_DETECTION_CONFIDENCE,
-                 min_tracking_confidence: float = DEFAULT_MIN_TRACKING_CONFIDENCE):
+                 min_tracking_confidence: float = DEFAULT_MIN_TRACKING_CONFIDENCE,
+                 frame_is_rgb: bool = False,
+                 inference_width: Optional[int] = DEFAULT_POSE_INFERENCE_WIDTH):
         """
         Initialize MediaPipe Pose detector.
         
@@ -29,10 +41,26 @@ class PoseDetector:
             smooth_landmarks: Whether to smooth landmarks across frames
             min_detection_confidence: Minimum confidence for person detection
             min_tracking_confidence: Minimum confidence for pose tracking
+            frame_is_rgb: detect() receives RGB frames and skips the BGR to RGB conversion
+                (the caller should mark them read-only to avoid a copy inside MediaPipe)
+            inference_width: Downscale wider frames to this width (keeping aspect ratio)
+                before detection, or None to use full resolution. Landmarks are normalized,
+                so results need no rescaling.
         """
         self.mp_pose = mp.solutions.pose
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
+        # Built once: the style getters construct a fresh DrawingSpec per landmark on every call
+        self._landmark_style = self.mp_drawing_styles.get_default_pose_landmarks_style()
+        
+        # Precomputed drawing tables: (M, 2) connection endpoints and per-landmark
+        # (border radius, radius, color, thickness) circle parameters
+        self._connections = np.array(sorted(self.mp_pose.POSE_CONNECTIONS), dtype=np.intp)
+        self._joint_specs = []
+        for index in range(len(self.mp_pose.PoseLandmark)):
+            spec = self._landmark_style[index]
+            border_radius = max(spec.circle_radius + 1, int(spec.circle_radius * 1.2))
+            self._joint_specs.append((border_radius, spec.circle_radius, spec.color, spec.thickness))
         
         self.pose = self.mp_pose.Pose(
             static_image_mode=static_image_mode,
@@ -42,12 +70,17 @@ class PoseDetector:
             min_tracking_confidence=min_tracking_confidence
         )
         
+        self.frame_is_rgb = frame_is_rgb
+        self.inference_width = inference_width
+        self._inference_size: Optional[Tuple[int, int]] = None  # (width, height) for the last frame shape
+        self._inference_src_shape: Optional[Tuple[int, ...]] = None
+        
     def detect(self, frame: np.ndarray) -> Optional[object]:
         """
         Detect pose in a frame.
         
         Args:
-            frame: BGR image from OpenCV
+            frame: BGR image from OpenCV (RGB if constructed with frame_is_rgb)
             
         Returns:
             Pose landmarks object if detected, None otherwise
@@ -55,10 +88,19 @@ class PoseDetector:
         if frame is None:
             return None
         
+        # MediaPipe resizes to its model input anyway; shrinking first cuts conversion and preprocessing work
+        if frame.shape != self._inference_src_shape:
+            self._inference_src_shape = frame.shape
+            self._inference_size = compute_inference_size(frame.shape[1], frame.shape[0], self.inference_width)
+        if self._inference_size is not None:
+            frame = cv2.resize(frame, self._inference_size, interpolation=cv2.INTER_AREA)
+        
         # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb_frame = frame if self.frame_is_rgb else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
-        # Process the frame
+        # Process the frame (read-only input lets MediaPipe reference it instead of copying)
+        if rgb_frame.flags.writeable:
+            rgb_frame.flags.writeable = False
         results = self.pose.process(rgb_frame)
         
         # Return landmarks if detected
@@ -70,7 +112,8 @@ class PoseDetector:
     def draw_landmarks(self, 
                        frame: np.ndarray, 
                        landmarks: object,
-                       draw_connections: bool = True) -> np.ndarray:
+                       draw_connections: bool = True,
+                       inplace: bool = False) -> np.ndarray:
         """
         Draw pose landmarks on frame.
         
@@ -78,6 +121,7 @@ class PoseDetector:
             frame: BGR image from OpenCV
             landmarks: Pose landmarks from detect()
             draw_connections: Whether to draw skeleton connections
+            inplace: Draw directly onto frame instead of a copy
             
         Returns:
             Frame with landmarks drawn
@@ -85,24 +129,39 @@ class PoseDetector:
         if landmarks is None:
             return frame
         
-        # Create a copy to avoid modifying original
-        annotated_frame = frame.copy()
+        # Create a copy to avoid modifying original, unless the caller owns the frame
+        annotated_frame = frame if inplace else frame.copy()
         
-        # Draw the pose landmarks
+        # Same output as mp_drawing.draw_landmarks with the default pose style, but with
+        # coordinates projected in one pass and all connections drawn in a single call
+        points = landmarks.landmark
+        data = np.fromiter(
+            (value for lm in points for value in (lm.x, lm.y, lm.visibility)),
+            dtype=np.float32,
+            count=len(points) * 3
+        ).reshape(-1, 3)
+        
+        # Landmarks outside the image or with low visibility are skipped
+        h, w = annotated_frame.shape[:2]
+        projected = project_and_filter(data, w, h, _VISIBILITY_THRESHOLD)
+        pixels = projected[:, :2]
+        visible = projected[:, 2].astype(bool)
+        
+        # Draw the skeleton connections between visible landmarks
         if draw_connections:
-            self.mp_drawing.draw_landmarks(
-                annotated_frame,
-                landmarks,
-                self.mp_pose.POSE_CONNECTIONS,
-                landmark_drawing_spec=self.mp_drawing_styles.get_default_pose_landmarks_style()
-            )
-        else:
-            self.mp_drawing.draw_landmarks(
-                annotated_frame,
-                landmarks,
-                None,
-                landmark_drawing_spec=self.mp_drawing_styles.get_default_pose_landmarks_style()
-            )
+            connections = self._connections[visible[self._connections].all(axis=1)]
+            if len(connections):
+                cv2.polylines(annotated_frame, pixels[connections], False, _CONNECTION_COLOR, _CONNECTION_THICKNESS)
+        
+        # Draw the joints
+        joint_specs = self._joint_specs
+        for index in np.flatnonzero(visible).tolist():
+            if index >= len(joint_specs):
+                break
+            border_radius, radius, color, thickness = joint_specs[index]
+            center = (int(pixels[index, 0]), int(pixels[index, 1]))
+            cv2.circle(annotated_frame, center, border_radius, _BORDER_COLOR, thickness)
+            cv2.circle(annotated_frame, center, radius, color, thickness)
         
         return annotated_frame
     
@@ -118,3 +177,19 @@ class PoseDetector:
             pass
 
 
+def pose_landmarks_to_array(landmarks: object) -> np.ndarray:
+    """
+    Copy pose landmark coordinates and visibility into a single array.
+    
+    Args:
+        landmarks: MediaPipe pose landmarks (33 points)
+        
+    Returns:
+        (N, 4) float32 array of normalized (x, y, z) and visibility per landmark
+    """
+    points = landmarks.landmark
+    return np.fromiter(
+        (value for lm in points for value in (lm.x, lm.y, lm.z, lm.visibility)),
+        dtype=np.float32,
+        count=len(points) * 4
+    ).reshape(-1, 4)
@@ -0,0 +1,43 @@
+"""Array kernels for pose landmark rendering"""
+
+import numpy as np
+
+# Numba is optional: when installed, the array kernels below compile to native code
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def project_and_filter(landmarks_xyv: np.ndarray, width: int, height: int, visibility_threshold: float) -> np.ndarray:
+    """
+    Project normalized landmarks to pixel coordinates and flag the drawable ones.
+    
+    Written with whole-array operations so it stays vectorized when numba is not
+    installed and compiles to a single fused loop when it is.
+    
+    Args:
+        landmarks_xyv: (N, 3) float32 array of normalized (x, y, visibility)
+        width: Image width in pixels
+        height: Image height in pixels
+        visibility_threshold: Minimum visibility for a landmark to be drawn
+        
+    Returns:
+        (N, 3) int32 array of (pixel x, pixel y, valid flag); valid landmarks are inside
+        the image and at least visibility_threshold visible
+    """
+    x = landmarks_xyv[:, 0]
+    y = landmarks_xyv[:, 1]
+    valid = ((landmarks_xyv[:, 2] >= visibility_threshold) &
+             (x >= 0.0) & (x <= 1.0) & (y >= 0.0) & (y <= 1.0))
+    
+    out = np.empty((landmarks_xyv.shape[0], 3), dtype=np.int32)
+    out[:, 0] = np.minimum(np.floor(x * width), width - 1).astype(np.int32)
+    out[:, 1] = np.minimum(np.floor(y * height), height - 1).astype(np.int32)
+    out[:, 2] = valid.astype(np.int32)
+    return out
@@ -1,10 +1,28 @@
 """GUI components"""
 
-from src.gui.main_window import MainWindow
-from src.gui.camera_widget import CameraWidget
-from src.gui.profile_editor import ProfileEditor
-from src.gui.gesture_monitor import GestureMonitor
+import importlib
 
-__all__ = ["MainWindow", "CameraWidget", "ProfileEditor", "GestureMonitor"]
+# Public names and the submodule defining each. Submodules (and with them OpenCV,
+# MediaPipe and the Qt widget modules) are imported on first attribute access (PEP 562).
+_EXPORTS = {
+    "MainWindow": "src.gui.main_window",
+    "CameraWidget": "src.gui.camera_widget",
+    "ProfileEditor": "src.gui.profile_editor",
+    "GestureMonitor": "src.gui.gesture_monitor",
+    "InferenceWorker": "src.gui.inference_worker"
+}
 
+__all__ = list(_EXPORTS)
 
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
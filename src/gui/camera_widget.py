@@ -33,9 +33,6 @@ class CameraWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
         
-        # Store current frame
-        self.current_frame = None
-        
         # Store detector references (shared, not created each frame)
         self.pose_detector = pose_detector
         self.hand_detector = None  # Will be set separately
@@ -44,6 +41,11 @@ class CameraWidget(QWidget):
         self.show_pose_skeleton = True
         self.show_hand_skeleton = True
         
+        # Reused display buffer (scaled BGR frame) and the QImage wrapping it;
+        # reallocated only when the scaled size changes
+        self._display_buf: Optional[np.ndarray] = None
+        self._display_image: Optional[QImage] = None
+        
     def set_pose_detector(self, pose_detector):
         """Set the pose detector instance for drawing landmarks"""
         self.pose_detector = pose_detector
@@ -62,7 +64,8 @@ class CameraWidget(QWidget):
         
     def update_frame(self, frame: Optional[np.ndarray], 
                     landmarks: Optional[object] = None,
-                    hands: Optional[Dict] = None):
+                    hands: Optional[Dict] = None,
+                    inplace: bool = False):
         """
         Update the displayed frame.
         
@@ -70,52 +73,67 @@ class CameraWidget(QWidget):
             frame: BGR image from OpenCV
             landmarks: Optional MediaPipe pose landmarks to draw
             hands: Optional hand detection results dictionary
+            inplace: Draw overlays directly onto frame (caller no longer needs it unmodified)
         """
         if frame is None:
             return
         
+        # Nothing on screen to update (detection and actions keep running regardless)
+        if not self.isVisible() or self.video_label.visibleRegion().isEmpty():
+            return
+        
         # Draw landmarks if provided (use shared detector instances)
-        # Only copy frame if we need to draw landmarks
+        # Unless inplace, the first overlay drawn copies the frame (the caller's frame
+        # stays unmodified); later overlays draw in place on that copy
         display_frame = frame
-        needs_copy = False
+        owns_frame = inplace
         
+        # Draw pose landmarks
         if landmarks is not None and self.pose_detector is not None and self.show_pose_skeleton:
-            needs_copy = True
+            display_frame = self.pose_detector.draw_landmarks(display_frame, landmarks, inplace=owns_frame)
+            owns_frame = True
         
+        # Draw hand landmarks
         if hands is not None and self.hand_detector is not None and self.show_hand_skeleton:
-            needs_copy = True
-        
-        if needs_copy:
-            display_frame = frame.copy()
-            
-            # Draw pose landmarks
-            if landmarks is not None and self.pose_detector is not None and self.show_pose_skeleton:
-                display_frame = self.pose_detector.draw_landmarks(display_frame, landmarks)
-            
-            # Draw hand landmarks
-            if hands is not None and self.hand_detector is not None and self.show_hand_skeleton:
-                display_frame = self.hand_detector.draw_landmarks(display_frame, hands)
-        
-        # Convert to Qt format (use display_frame which may be original or annotated)
-        frame_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame_rgb.shape
-        bytes_per_line = ch * w
-        
-        qt_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        
-        # Scale to fit widget while maintaining aspect ratio
-        scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-            self.video_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        self.video_label.setPixmap(scaled_pixmap)
+            display_frame = self.hand_detector.draw_landmarks(display_frame, hands, inplace=owns_frame)
+        
+        scaled_image = self._scale_to_label(display_frame)
+        if scaled_image is not None:
+            self.video_label.setPixmap(QPixmap.fromImage(scaled_image))
+    
+    def _scale_to_label(self, frame: np.ndarray) -> Optional[QImage]:
+        """
+        Scale a BGR frame to fit the video label (keeping aspect ratio) into the reused buffer.
+        
+        Downscaling uses area averaging so thin overlay lines drawn before scaling do not
+        break up; upscaling uses nearest-neighbour, which is cheap and cannot drop lines.
+        Qt reads BGR888 natively, so no colour conversion is needed.
+        
+        Returns:
+            QImage wrapping the display buffer (valid until the next call), or None if the
+            label has no area
+        """
+        label_w = self.video_label.width()
+        label_h = self.video_label.height()
+        h, w = frame.shape[:2]
+        if label_w <= 0 or label_h <= 0 or w == 0 or h == 0:
+            return None
+        
+        scale = min(label_w / w, label_h / h)
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        
+        if self._display_buf is None or self._display_buf.shape[1::-1] != size:
+            self._display_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self._display_image = QImage(self._display_buf.data, size[0], size[1],
+                                         self._display_buf.strides[0], QImage.Format.Format_BGR888)
+        
+        interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_NEAREST
+        cv2.resize(frame, size, dst=self._display_buf, interpolation=interpolation)
+        return self._display_image
     
     def clear(self):
         """Clear the video display"""
         self.video_label.clear()
         self.video_label.setText("No camera feed")
-        # self.current_frame = None  # No longer storing frame reference
 
 
@@ -4,9 +4,14 @@ from PyQt6.QtWidgets import (QWidget, QTableWidget, QTableWidgetItem,
                               QVBoxLayout, QHeaderView, QLabel)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
-from typing import List, Tuple, Dict
+from typing import List, Tuple
 from src.actions.base_action import BaseAction
 
+_INACTIVE_COLOR = QColor(200, 200, 200)
+_ACTIVE_COLOR = QColor(100, 255, 100)
+_INACTIVE_STATE = (False, 0)  # (is_active, value percent) shown for a row
+_PERCENT_TEXT = tuple(f"{percent}%" for percent in range(101))  # Value column text for 0-100%
+
 
 class GestureMonitor(QWidget):
     """Widget for displaying active gestures in real-time"""
@@ -39,82 +44,97 @@ class GestureMonitor(QWidget):
         layout.addWidget(self.table)
         self.setLayout(layout)
         
-        # Store gesture data
-        self.gesture_rows: Dict[str, int] = {}
+        # Displayed (is_active, value percent) per row, so unchanged cells aren't rewritten
+        self._last_state: List[Tuple[bool, int]] = []
         
     def set_gestures(self, gesture_names: List[str]):
         """
         Initialize the table with gesture names.
         
         Args:
-            gesture_names: List of gesture names to display
+            gesture_names: List of gesture names to display, in gesture ID order
         """
         self.table.setRowCount(len(gesture_names))
-        self.gesture_rows.clear()
+        self._last_state = [_INACTIVE_STATE] * len(gesture_names)
         
         for i, name in enumerate(gesture_names):
-            self.gesture_rows[name] = i
-            
             # Gesture name
             name_item = QTableWidgetItem(name)
             self.table.setItem(i, 0, name_item)
             
             # Status
             status_item = QTableWidgetItem("Inactive")
-            status_item.setBackground(QColor(200, 200, 200))
+            status_item.setBackground(_INACTIVE_COLOR)
             self.table.setItem(i, 1, status_item)
             
             # Value
-            value_item = QTableWidgetItem("0%")
+            value_item = QTableWidgetItem(_PERCENT_TEXT[0])
             self.table.setItem(i, 2, value_item)
     
-    def update_status(self, active_gestures: List[Tuple[str, BaseAction, bool, float]]):
+    def update_status(self, active_gestures: List[Tuple[int, BaseAction, bool, float]]):
         """
         Update the status of gestures.
         
         Args:
-            active_gestures: List of (gesture_name, action, is_active, trigger_value) tuples
+            active_gestures: List of (gesture_id, action, is_active, trigger_value) tuples
         """
-        # First, mark all as inactive
-        for row in range(self.table.rowCount()):
-            status_item = self.table.item(row, 1)
-            value_item = self.table.item(row, 2)
-            
-            if status_item:
-                status_item.setText("Inactive")
-                status_item.setBackground(QColor(200, 200, 200))
-            
-            if value_item:
-                value_item.setText("0%")
+        # Rows are in gesture ID order. Single pass over the reported gestures, collecting
+        # only rows whose displayed state differs
+        last_state = self._last_state
+        row_count = len(last_state)
+        changed = []
+        reported = 0
+        for row, action, is_active, trigger_value in active_gestures:
+            # Validate row index
+            if 0 <= row < row_count:
+                reported += 1
+                state = (is_active, int(trigger_value * 100))
+                if state != last_state[row]:
+                    changed.append((row, state))
         
-        # Update active gestures
-        for gesture_name, action, is_active, trigger_value in active_gestures:
-            if gesture_name in self.gesture_rows:
-                row = self.gesture_rows[gesture_name]
-                
-                # Validate row index
-                if row < 0 or row >= self.table.rowCount():
-                    continue
+        # Rows not reported this time (e.g. a trigger raised) are shown inactive
+        if reported < row_count:
+            seen = {gesture[0] for gesture in active_gestures}
+            changed.extend(
+                (row, _INACTIVE_STATE) for row in range(row_count)
+                if row not in seen and last_state[row] != _INACTIVE_STATE
+            )
+        
+        if not changed:
+            return
+        
+        # Touch only changed cells, with repaints and item signals coalesced into one update
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            for row, state in changed:
+                is_active, value_percent = state
+                previous_active, previous_percent = last_state[row]
                 
                 status_item = self.table.item(row, 1)
-                value_item = self.table.item(row, 2)
-                
-                if status_item:
+                if status_item and is_active != previous_active:
                     if is_active:
                         status_item.setText("Active")
-                        status_item.setBackground(QColor(100, 255, 100))
+                        status_item.setBackground(_ACTIVE_COLOR)
                     else:
                         status_item.setText("Inactive")
-                        status_item.setBackground(QColor(200, 200, 200))
+                        status_item.setBackground(_INACTIVE_COLOR)
+                
+                value_item = self.table.item(row, 2)
+                if value_item and value_percent != previous_percent:
+                    if 0 <= value_percent <= 100:
+                        value_item.setText(_PERCENT_TEXT[value_percent])
+                    else:
+                        value_item.setText(f"{value_percent}%")
                 
-                if value_item:
-                    # Update value
-                    value_percent = int(trigger_value * 100)
-                    value_item.setText(f"{value_percent}%")
+                last_state[row] = state
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
     
     def clear(self):
         """Clear all gesture data"""
         self.table.setRowCount(0)
-        self.gesture_rows.clear()
+        self._last_state = []
 
 
@@ -0,0 +1,205 @@
+"""Background worker running pose and hand detection off the GUI thread"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+from typing import Optional, Tuple
+from src.detection.pose_detector import pose_landmarks_to_array
+from src.utils.image_utils import compute_inference_size
+
+_log = logging.getLogger(__name__)
+
+_FRAME_WAIT_TIMEOUT = 0.1  # Seconds; bounds how long stop() waits for the loop to notice
+_WARM_UP_FRAME_SHAPE = (360, 640, 3)  # Blank RGB frame used to initialize the detector graphs
+_INFERENCE_MS_SMOOTHING = 0.1  # Weight of the newest sample in the inference time average
+
+
+class InferenceWorker(QThread):
+    """
+    Runs detection on the latest camera frame and hands results to the GUI thread.
+    
+    Results go through a single "latest wins" slot: if the GUI thread has not taken
+    the previous result yet, it is replaced (and counted as dropped) instead of queued.
+    """
+    
+    # Emitted when the result slot goes from empty to filled; call take_result()
+    results_ready = pyqtSignal()
+    # Emitted when the camera stops delivering frames on its own (disconnect)
+    camera_lost = pyqtSignal()
+    
+    def __init__(self, camera, pose_detector, hand_detector, parent=None):
+        """
+        Initialize inference worker.
+        
+        Args:
+            camera: Started CameraCapture to read frames from
+            pose_detector: PoseDetector constructed with frame_is_rgb=True
+            hand_detector: HandDetector constructed with frame_is_rgb=True
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.camera = camera
+        self.pose_detector = pose_detector
+        self.hand_detector = hand_detector
+        
+        self._running = False
+        self._lock = threading.Lock()
+        self._result: Optional[Tuple[object, object, object, object]] = None  # (frame, landmarks, pose_array, hands)
+        self._dropped = 0
+        # Smoothed per-frame detection time in milliseconds (written by the worker thread)
+        self.inference_ms = 0.0
+        
+        # Shared pre-conversion size, recomputed only when the camera frame shape changes
+        self._prescale_size: Optional[Tuple[int, int]] = None
+        self._prescale_src_shape: Optional[Tuple[int, ...]] = None
+        # Reused CPU-path buffers for the downscaled BGR frame and its RGB conversion. Safe to
+        # overwrite each frame: both detectors are done with the previous one by then.
+        self._small_buf: Optional[np.ndarray] = None
+        self._rgb_buf: Optional[np.ndarray] = None
+        
+        self._warm_up_thread: Optional[threading.Thread] = None
+        
+        # Shared downscale and RGB conversion through OpenCV's OpenCL (T-API) path: one upload,
+        # both operations on the device, one readback (MediaPipe needs a host array). Follows
+        # the process-wide switch set once at startup from USE_OPENCL; false if unavailable.
+        self._use_opencl = cv2.ocl.useOpenCL()
+    
+    def warm_up(self):
+        """
+        Run both detectors once on a blank frame on a background thread.
+        
+        The first MediaPipe call pays for graph and model initialization; doing it ahead of
+        time keeps that cost off the first live frames. run() waits for it to finish.
+        """
+        if self._warm_up_thread is None:
+            self._warm_up_thread = threading.Thread(
+                target=self._warm_up_detectors, name="DetectorWarmUp", daemon=True)
+            self._warm_up_thread.start()
+    
+    def _warm_up_detectors(self):
+        """Initialize the detector graphs (runs on the warm-up thread)"""
+        blank = np.zeros(_WARM_UP_FRAME_SHAPE, dtype=np.uint8)
+        blank.flags.writeable = False
+        try:
+            self.pose_detector.detect(blank)
+            self.hand_detector.detect(blank)
+        except Exception:
+            _log.warning("Detector warm-up failed", exc_info=True)
+    
+    def wait_warm_up(self):
+        """Block until a warm-up started by warm_up() has finished (the detectors are not reentrant)"""
+        if self._warm_up_thread is not None:
+            self._warm_up_thread.join()
+    
+    def start(self, *args, **kwargs):
+        """Start the detection thread (the running flag is set here so an early stop() is not lost)"""
+        self._running = True
+        super().start(*args, **kwargs)
+    
+    def run(self):
+        """Detection loop (runs on the worker thread; exits once stop() clears the running flag)"""
+        self.wait_warm_up()
+        # Hand detection runs on a helper thread alongside pose detection on this one (MediaPipe
+        # releases the GIL during inference). Each detector is only ever used by one thread.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="HandDetection") as hand_pool:
+            self._detect_loop(hand_pool)
+    
+    def _detect_loop(self, hand_pool: ThreadPoolExecutor):
+        """Run detection on frames until stopped or the camera is lost"""
+        while self._running:
+            # Block until the capture thread hands over a frame (timeout so stop() is noticed)
+            frame = self.camera.wait_frame(_FRAME_WAIT_TIMEOUT)
+            if frame is None:
+                if not self.camera.is_running:
+                    if self._running:
+                        self.camera_lost.emit()
+                    return
+                continue
+            
+            # Flip frame horizontally for mirror-like display (more intuitive for testing).
+            # This also copies the frame out of the camera's reused capture buffer.
+            frame = cv2.flip(frame, 1)
+            
+            # One shared, read-only RGB conversion for both detectors, done after
+            # downscaling so only the pixels the detectors use get converted
+            if frame.shape != self._prescale_src_shape:
+                self._prescale_src_shape = frame.shape
+                self._prescale_size = self._compute_prescale_size(frame.shape[1], frame.shape[0])
+            if self._use_opencl:
+                small = cv2.UMat(frame)
+                if self._prescale_size is not None:
+                    small = cv2.resize(small, self._prescale_size, interpolation=cv2.INTER_AREA)
+                rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB).get()
+            else:
+                if self._prescale_size is None:
+                    small = frame
+                else:
+                    small = self._small_buf = cv2.resize(
+                        frame, self._prescale_size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+                if self._rgb_buf is not None:
+                    self._rgb_buf.flags.writeable = True
+                rgb_frame = self._rgb_buf = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            rgb_frame.flags.writeable = False
+            start = time.perf_counter()
+            try:
+                hands_future = hand_pool.submit(self.hand_detector.detect, rgb_frame)
+                try:
+                    landmarks = self.pose_detector.detect(rgb_frame)
+                finally:
+                    hands = hands_future.result()
+                # (33, 4) pose coordinates and visibility for the gesture engine, extracted here rather
+                # than on the GUI thread. A fresh array per frame: the GUI thread may still hold the last one.
+                pose_array = pose_landmarks_to_array(landmarks) if landmarks is not None else None
+            except Exception:
+                _log.warning("Detection failed", exc_info=True)
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self.inference_ms += _INFERENCE_MS_SMOOTHING * (elapsed_ms - self.inference_ms)
+            
+            with self._lock:
+                pending = self._result is not None
+                self._result = (frame, landmarks, pose_array, hands)
+                if pending:
+                    self._dropped += 1
+            if not pending:
+                self.results_ready.emit()
+    
+    def _compute_prescale_size(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """Size both detectors can share: the larger of their inference widths (None if either is unlimited)"""
+        widths = (self.pose_detector.inference_width, self.hand_detector.inference_width)
+        if None in widths:
+            return None
+        return compute_inference_size(width, height, max(widths))
+    
+    def stop(self):
+        """Stop the detection loop, wait for it to exit and discard any pending result"""
+        self._running = False
+        self.wait()
+        with self._lock:
+            self._result = None
+            self._dropped = 0
+    
+    def take_result(self) -> Optional[Tuple[object, object, object, object]]:
+        """
+        Take the latest detection result.
+        
+        Returns:
+            (frame, landmarks, pose_array, hands) tuple, or None if no new result is available.
+            frame is the flipped BGR frame, owned by the caller; pose_array is the (33, 4)
+            landmark array (None when no pose was detected).
+        """
+        with self._lock:
+            result = self._result
+            self._result = None
+        return result
+    
+    def take_dropped_count(self) -> int:
+        """Return and reset the number of results replaced before the GUI thread took them"""
+        with self._lock:
+            dropped = self._dropped
+            self._dropped = 0
+        return dropped
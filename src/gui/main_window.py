@@ -1,13 +1,14 @@
 """Main application window"""
 
+import copy
+import logging
 import sys
 import time
-import cv2
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QPushButton, QLabel, QFileDialog, QMessageBox,
                               QMenuBar, QMenu, QToolBar, QStatusBar, QCheckBox)
-from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QAction, QGuiApplication
 from typing import Optional
 
 from src.capture.camera_capture import CameraCapture
@@ -15,10 +16,16 @@ from src.detection.pose_detector import PoseDetector
 from src.detection.hand_detector import HandDetector
 from src.recognition.gesture_engine import GestureEngine
 from src.actions.action_dispatcher import ActionDispatcher
+from src.actions.dispatch_worker import DispatchWorker
 from src.config.profile_manager import ProfileManager
 from src.config.profile_schema import Profile
 from src.gui.camera_widget import CameraWidget
 from src.gui.gesture_monitor import GestureMonitor
+from src.gui.inference_worker import InferenceWorker
+from src.gui.profile_editor import ProfileEditor
+from src.utils.constants import GESTURE_MONITOR_UPDATE_INTERVAL_MS, MAX_FRAME_SKIP_COUNT
+
+_log = logging.getLogger(__name__)
 
 
 class MainWindow(QMainWindow):
@@ -30,32 +37,66 @@ class MainWindow(QMainWindow):
         
         # Initialize components
         self.camera = CameraCapture()
-        self.pose_detector = PoseDetector()
-        self.hand_detector = HandDetector(max_num_hands=2)  # Detect both hands
+        # Both detectors take the RGB frame converted once per frame by the inference worker.
+        # Built once and kept in streaming mode (static_image_mode=False) so MediaPipe runs its
+        # lightweight tracker between frames and only re-runs full detection when tracking is lost.
+        self.pose_detector = PoseDetector(static_image_mode=False, frame_is_rgb=True)
+        self.hand_detector = HandDetector(static_image_mode=False, max_num_hands=2, frame_is_rgb=True)  # Detect both hands
         self.gesture_engine = GestureEngine()
         self.action_dispatcher = ActionDispatcher()
+        # Drives the dispatcher on its own thread while the camera runs
+        self.dispatch_worker = DispatchWorker(self.action_dispatcher)
         self.profile_manager = ProfileManager()
         
         # State
         self.current_profile: Optional[Profile] = None
         self.is_running = False
-        self.frame_count = 0
+        self.frame_count = 0  # Frames processed since the camera started
         self.fps = 0.0
-        self.last_fps_update = time.time()
+        self.last_fps_update = time.perf_counter()
+        self._fps_window_start_count = 0  # frame_count at last_fps_update
         self._camera_disconnect_warning_shown = False  # Prevent multiple disconnect dialogs
+        self._last_error_log = float("-inf")  # perf_counter() time of the last logged frame error
         
         # Setup UI
         self.setup_ui()
         
-        # Setup processing timer
-        from src.utils.constants import PROCESSING_TIMER_INTERVAL_MS
-        self.processing_timer = QTimer()
-        self.processing_timer.timeout.connect(self.process_frame)
+        # Detection runs on a worker thread; results are processed on the GUI thread
+        self.inference_worker = InferenceWorker(self.camera, self.pose_detector, self.hand_detector, self)
+        self.inference_worker.results_ready.connect(self.process_frame)
+        self.inference_worker.camera_lost.connect(self.on_camera_lost)
+        # Initialize the MediaPipe graphs in the background while the window comes up
+        self.inference_worker.warm_up()
         
-        # Performance optimization: skip frame if still processing
-        self.is_processing = False
+        # Results the GUI thread didn't get to before a newer one replaced them
         self.frame_skip_counter = 0
         
+        # Camera view repaints are capped at the display refresh rate; gestures still run every frame
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0.0
+        self._paint_period = 1.0 / refresh_rate if refresh_rate > 0 else 1.0 / 60.0
+        self._last_paint = 0.0
+        # A result that arrived too soon after the last paint is kept and shown when the period
+        # ends, so the view never stays on a stale frame if results stop coming
+        self._pending_paint = None  # (frame, landmarks, hands)
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._paint_timer.timeout.connect(self._paint_pending)
+        
+        # Gesture monitor refreshes on its own ~10 Hz timer from the latest gesture results
+        self._last_active_gestures = None  # Set by process_frame, consumed by the timer
+        self._monitor_timer = QTimer(self)
+        # Display-only work: coarse timing lets Qt coalesce wakeups; frame processing isn't timer-driven
+        self._monitor_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._monitor_timer.timeout.connect(self._update_gesture_monitor)
+        
+        # FPS and dropped-result reporting, once per second
+        self._fps_timer = QTimer(self)
+        self._fps_timer.timeout.connect(self._update_fps)
+        self._last_frames_grabbed = 0  # Camera counters at the previous report
+        self._last_frames_skipped = 0
+        
         # Load example profile if available
         self.try_load_example_profile()
     
@@ -231,18 +272,23 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Camera started")
             
             # Reset processing state
-            self.is_processing = False
             self.frame_count = 0
             self.frame_skip_counter = 0
-            self.last_fps_update = time.time()
+            self.last_fps_update = time.perf_counter()
+            self._fps_window_start_count = 0
+            self._last_frames_grabbed = 0
+            self._last_frames_skipped = 0
             
             # Prevent keyboard shortcuts from interfering with actions
             # Focus on the camera widget so buttons don't get keyboard events
             self.camera_widget.setFocus()
             
-            # Start processing timer
-            from src.utils.constants import PROCESSING_TIMER_INTERVAL_MS
-            self.processing_timer.start(PROCESSING_TIMER_INTERVAL_MS)
+            # Start detection
+            self._camera_disconnect_warning_shown = False
+            self.dispatch_worker.start()
+            self.inference_worker.start()
+            self._monitor_timer.start(GESTURE_MONITOR_UPDATE_INTERVAL_MS)
+            self._fps_timer.start(1000)
         else:
             QMessageBox.critical(
                 self, 
@@ -257,113 +303,151 @@ class MainWindow(QMainWindow):
     
     def stop_camera(self):
         """Stop camera and processing"""
-        self.processing_timer.stop()
+        # Stop the worker first so it doesn't mistake the stopped camera for a disconnect
+        self.inference_worker.stop()
         self.camera.stop()
         self.is_running = False
+        self._monitor_timer.stop()
+        self._fps_timer.stop()
+        self._last_active_gestures = None
+        self._paint_timer.stop()
+        self._pending_paint = None
         
-        # Release all active actions
-        self.action_dispatcher.release_all()
+        # Stop dispatching and release all active actions
+        self.dispatch_worker.stop()
         
         self.start_stop_button.setText("Start Camera")
         self.status_label.setText("Camera: Stopped")
         self.status_bar.showMessage("Camera stopped")
         self.camera_widget.clear()
     
+    def _update_fps(self):
+        """Show FPS, inference time and dropped results for the last window (FPS timer slot)"""
+        now = time.perf_counter()
+        self.fps = (self.frame_count - self._fps_window_start_count) / (now - self.last_fps_update)
+        inference_ms = self.inference_worker.inference_ms
+        self.frame_skip_counter = self.inference_worker.take_dropped_count()
+        
+        # Pipeline telemetry for this window: camera frames skipped before decoding, and the
+        # share of detection results replaced before the GUI thread took them
+        grabbed = self.camera.frames_grabbed
+        skipped = self.camera.frames_skipped
+        window_grabbed = grabbed - self._last_frames_grabbed
+        window_skipped = skipped - self._last_frames_skipped
+        self._last_frames_grabbed = grabbed
+        self._last_frames_skipped = skipped
+        results = (self.frame_count - self._fps_window_start_count) + self.frame_skip_counter
+        drop_rate = self.frame_skip_counter / results if results else 0.0
+        self.fps_label.setText(
+            f"FPS: {self.fps:.1f} | Inference: {inference_ms:.1f} ms | "
+            f"Camera skipped: {window_skipped} | Dropped: {drop_rate:.0%}"
+        )
+        _log.debug(
+            "FPS %.1f | camera: %d frames, %d skipped undecoded | results dropped: %d (%.0f%%) | inference %.1f ms",
+            self.fps, window_grabbed, window_skipped, self.frame_skip_counter, drop_rate * 100, inference_ms
+        )
+        if self.frame_skip_counter > 0:
+            if self.frame_skip_counter > MAX_FRAME_SKIP_COUNT:
+                self.status_bar.showMessage(
+                    f"FPS: {self.fps:.1f} (Warning: Skipped {self.frame_skip_counter} frames - performance degraded)",
+                    5000  # Show for 5 seconds
+                )
+            else:
+                self.status_bar.showMessage(f"FPS: {self.fps:.1f} (Skipped {self.frame_skip_counter} frames")
+        self._fps_window_start_count = self.frame_count
+        self.frame_skip_counter = 0
+        self.last_fps_update = now
+    
+    def _paint_pending(self):
+        """Show the result held back by the paint throttle (paint timer slot)"""
+        if self._pending_paint is None or not self.is_running:
+            return
+        frame, landmarks, hands = self._pending_paint
+        self._pending_paint = None
+        self.camera_widget.update_frame(frame, landmarks, hands, inplace=True)
+        self._last_paint = time.perf_counter()
+    
+    def _update_gesture_monitor(self):
+        """Show the latest gesture results in the gesture monitor (monitor timer slot)"""
+        if self._last_active_gestures is None:
+            return
+        active_gestures = self._last_active_gestures
+        self._last_active_gestures = None
+        self.gesture_monitor.update_status(active_gestures)
+    
+    def on_camera_lost(self):
+        """Handle the camera disconnecting while running (signalled by the inference worker)"""
+        if not self.is_running or self._camera_disconnect_warning_shown:
+            return
+        self._camera_disconnect_warning_shown = True
+        self.stop_camera()
+        QMessageBox.warning(
+            self,
+            "Camera Disconnected",
+            "Camera was disconnected. Please reconnect and restart."
+        )
+    
     def process_frame(self):
-        """Process a single frame (called by timer)"""
-        # Skip if still processing previous frame
-        if self.is_processing:
-            self.frame_skip_counter += 1
+        """Process the latest detection result (called when the inference worker has one)"""
+        if not self.is_running:
+            return
+        
+        result = self.inference_worker.take_result()
+        if result is None:
             return
         
-        self.is_processing = True
         try:
-            # 1. Capture frame
-            frame = self.camera.get_frame()
-            if frame is None:
-                # Camera may have disconnected
-                if not self.camera.is_running and not self._camera_disconnect_warning_shown:
-                    self._camera_disconnect_warning_shown = True
-                    self.stop_camera()
-                    QMessageBox.warning(
-                        self,
-                        "Camera Disconnected",
-                        "Camera was disconnected. Please reconnect and restart."
-                    )
-                self.is_processing = False
-                return
-            
-            # Reset disconnect warning flag if camera is working
-            if self._camera_disconnect_warning_shown and self.camera.is_running:
-                self._camera_disconnect_warning_shown = False
-            
-            # Flip frame horizontally for mirror-like display (more intuitive for testing)
-            frame = cv2.flip(frame, 1)
-            
-            # 2. Detect pose and hands
-            landmarks = self.pose_detector.detect(frame)
-            hands = self.hand_detector.detect(frame)
+            # 1-2. Frame capture and pose/hand detection ran on the inference worker
+            frame, landmarks, pose_array, hands = result
             
             # 3. Recognize gestures and execute actions
-            # Prepare frame data with both pose and hands for triggers that need hand data
+            # Prepare frame data with hands for triggers that need hand data
             frame_data = {
                 "hands": hands,
                 "frame": frame
             }
             
-            if landmarks is not None:
-                try:
-                    active_gestures = self.gesture_engine.process(landmarks, frame_data)
-                    self.action_dispatcher.dispatch(active_gestures)
-                    
-                    # Update gesture monitor (throttled for performance)
-                    from src.utils.constants import GESTURE_MONITOR_UPDATE_INTERVAL
-                    if self.frame_count % GESTURE_MONITOR_UPDATE_INTERVAL == 0:
-                        self.gesture_monitor.update_status(active_gestures)
-                except Exception as e:
-                    print(f"Warning: Error processing gestures: {e}")
-                    import traceback
-                    traceback.print_exc()
+            if pose_array is not None:
+                # Triggers read the (33, 4) landmark array built on the inference worker;
+                # the MediaPipe landmarks are only used for drawing. The engine handles
+                # per-gesture errors itself; gestures that fail to build or fail a dry run
+                # are dropped when the profile is set.
+                active_gestures = self.gesture_engine.process(pose_array, frame_data)
+                self.dispatch_worker.submit(active_gestures)
+                
+                # Picked up by the gesture monitor timer
+                self._last_active_gestures = active_gestures
             else:
                 # No person detected - release all actions
-                try:
-                    self.action_dispatcher.release_all()
-                except Exception as e:
-                    print(f"Warning: Error releasing actions: {e}")
+                self.dispatch_worker.release_all()
             
-            # 4. Update GUI with pose and hands
-            self.camera_widget.update_frame(frame, landmarks, hands)
+            # 4. Update GUI with pose and hands (frame is the flipped copy handed over by the
+            # worker, so overlays can be drawn on it directly), at most once per display refresh.
+            # Skipped while minimized (the widget itself skips hidden/fully covered states);
+            # gestures keep running since the user may be playing with the window minimized.
+            now = time.perf_counter()
+            if not self.isMinimized():
+                remaining = self._paint_period - (now - self._last_paint)
+                if remaining <= 0:
+                    self._paint_timer.stop()
+                    self._pending_paint = None
+                    self.camera_widget.update_frame(frame, landmarks, hands, inplace=True)
+                    self._last_paint = now
+                else:
+                    self._pending_paint = (frame, landmarks, hands)
+                    if not self._paint_timer.isActive():
+                        self._paint_timer.start(max(1, int(remaining * 1000)))
             
-            # Update FPS
+            # Counted here, reported by the FPS timer
             self.frame_count += 1
-            current_time = time.time()
-            if current_time - self.last_fps_update >= 1.0:
-                self.fps = self.frame_count / (current_time - self.last_fps_update)
-                self.fps_label.setText(f"FPS: {self.fps:.1f}")
-                from src.utils.constants import MAX_FRAME_SKIP_COUNT
-                if self.frame_skip_counter > 0:
-                    if self.frame_skip_counter > MAX_FRAME_SKIP_COUNT:
-                        self.status_bar.showMessage(
-                            f"FPS: {self.fps:.1f} (Warning: Skipped {self.frame_skip_counter} frames - performance degraded)",
-                            5000  # Show for 5 seconds
-                        )
-                    else:
-                        self.status_bar.showMessage(f"FPS: {self.fps:.1f} (Skipped {self.frame_skip_counter} frames")
-                self.frame_count = 0
-                self.frame_skip_counter = 0
-                self.last_fps_update = current_time
                 
         except Exception as e:
-            print(f"Error processing frame: {e}")
-            import traceback
-            traceback.print_exc()
-            # Ensure processing flag is reset even on error
-            self.is_processing = False
-            # Don't let errors stop the camera - continue processing
-        finally:
-            # Always reset processing flag
-            if self.is_processing:
-                self.is_processing = False
+            # Don't let errors stop the camera - continue processing. A persistent error would
+            # repeat every frame, so only log a traceback once per second.
+            now = time.perf_counter()
+            if now - self._last_error_log >= 1.0:
+                self._last_error_log = now
+                _log.exception("Error processing frame: %s", e)
     
     def load_profile(self):
         """Load a profile from file"""
@@ -418,16 +502,25 @@ class MainWindow(QMainWindow):
         )
         
         # Load gestures into engine
-        gestures_config = [g.model_dump() for g in profile.gestures]
+        gestures_config = [g.to_dict() for g in profile.gestures]
         self.gesture_engine.load_gestures(gestures_config)
+        dropped = self.gesture_engine.validate()
         
-        # Update gesture monitor
+        # Size dispatcher state and gesture monitor rows by gesture ID. If stop_camera() timed
+        # out, the old dispatch thread may still be releasing; wait so only one thread at a
+        # time touches the dispatcher.
         gesture_names = self.gesture_engine.get_gesture_names()
+        self.dispatch_worker.join()
+        self.action_dispatcher.set_gestures(gesture_names)
         self.gesture_monitor.set_gestures(gesture_names)
         
         # Restart camera if it was running
         if was_running:
             self.start_camera()
+        
+        if dropped:
+            QMessageBox.warning(self, "Invalid Gestures",
+                                "These gestures failed validation and were skipped:\n" + "\n".join(dropped))
     
     def try_load_example_profile(self):
         """Try to load the example profile on startup"""
@@ -438,9 +531,6 @@ class MainWindow(QMainWindow):
     
     def new_profile(self):
         """Create a new profile"""
-        from src.gui.profile_editor import ProfileEditor
-        from src.config.profile_schema import Profile
-        
         # Create empty profile
         new_profile = Profile(name="New Profile", description="", game="", gestures=[])
         
@@ -452,13 +542,13 @@ class MainWindow(QMainWindow):
     
     def edit_profile(self):
         """Edit the current profile"""
-        from src.gui.profile_editor import ProfileEditor
-        
         if self.current_profile is None:
             QMessageBox.warning(self, "No Profile", "No profile to edit. Please load or create a profile first.")
             return
         
-        dialog = ProfileEditor(self.current_profile, self)
+        # The editor changes the profile in place; give it a copy so a cancelled edit leaves
+        # the current profile (possibly shared with the profile manager's cache) untouched
+        dialog = ProfileEditor(copy.deepcopy(self.current_profile), self)
         if dialog.exec() == ProfileEditor.DialogCode.Accepted:
             profile = dialog.get_profile()
             self.set_profile(profile)
@@ -489,6 +579,7 @@ class MainWindow(QMainWindow):
             self.stop_camera()
         
         # Cleanup
+        self.inference_worker.wait_warm_up()
         self.pose_detector.close()
         self.hand_detector.close()
         
@@ -8,8 +8,11 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+import cv2
 from PyQt6.QtWidgets import QApplication
 from src.gui.main_window import MainWindow
+from src.utils.logging_setup import setup_logging
+from src.utils.constants import USE_OPENCL
 
 # Import to register all triggers and actions
 import src.recognition.triggers
@@ -18,6 +21,13 @@ import src.actions.executors
 
 def main():
     """Main application entry point"""
+    # Keep console output off the frame processing path
+    setup_logging()
+    
+    # OpenCV's OpenCL switch is process-wide: set it once here from the config (the inference
+    # worker picks its preprocessing path from it). OpenCV otherwise enables it by default.
+    cv2.ocl.setUseOpenCL(USE_OPENCL)
+    
     # Create Qt application
     app = QApplication(sys.argv)
     app.setApplicationName("Motion Controller")
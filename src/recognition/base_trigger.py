@@ -31,8 +31,9 @@ class BaseTrigger(ABC):
         Detect if trigger condition is met.
         
         Args:
-            landmarks: MediaPipe pose landmarks
-            frame_data: Additional frame information (timestamp, frame_number, etc)
+            landmarks: (33, 4) pose landmark array from pose_landmarks_to_array()
+                (MediaPipe pose landmarks are also accepted by the landmark helpers)
+            frame_data: Additional frame information (monotonic timestamp in seconds, frame_number, etc)
             
         Returns:
             True if trigger is active, False otherwise
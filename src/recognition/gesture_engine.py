@@ -1,12 +1,16 @@
 """Gesture recognition engine that coordinates triggers and actions"""
 
+import logging
 import time
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
 from src.recognition.trigger_registry import TriggerRegistry
 from src.actions.action_registry import ActionRegistry
 from src.recognition.base_trigger import BaseTrigger
 from src.actions.base_action import BaseAction
 
+_log = logging.getLogger(__name__)
+
 
 class GestureDefinition:
     """Represents a single gesture with trigger and action"""
@@ -34,6 +38,13 @@ class GestureEngine:
         self.gestures: List[GestureDefinition] = []
         self.frame_number = 0
         
+        # Per-gesture (gesture_id, gesture, bound trigger.detect, bound trigger.get_value, action),
+        # rebuilt whenever gestures are loaded so process() does no attribute lookups per gesture
+        self._compiled: List[Tuple[int, GestureDefinition, Callable, Callable, BaseAction]] = []
+        
+        # Per-gesture monotonic time of the last logged processing error, indexed by gesture ID
+        self._last_error_log: List[float] = []
+        
     def load_gestures(self, gestures_config: List[Dict[str, Any]]):
         """
         Load gestures from configuration.
@@ -65,55 +76,98 @@ class GestureEngine:
                 self.gestures.append(gesture_def)
                 
             except KeyError as e:
-                print(f"Error: Failed to load gesture '{gesture_config.get('name', 'unknown')}': "
-                      f"Missing required field: {e}")
+                _log.error("Failed to load gesture '%s': Missing required field: %s",
+                           gesture_config.get("name", "unknown"), e)
             except Exception as e:
-                print(f"Warning: Failed to load gesture '{gesture_config.get('name', 'unknown')}': {e}")
-                import traceback
-                traceback.print_exc()
+                _log.warning("Failed to load gesture '%s': %s",
+                             gesture_config.get("name", "unknown"), e, exc_info=True)
+        
+        self._compile()
+    
+    def _compile(self):
+        """Bind each gesture's trigger and action once for the per-frame loop"""
+        self._compiled = [
+            (gesture_id, gesture, gesture.trigger.detect, gesture.trigger.get_value, gesture.action)
+            for gesture_id, gesture in enumerate(self.gestures)
+        ]
+        self._last_error_log = [float("-inf")] * len(self.gestures)
+    
+    def validate(self) -> List[str]:
+        """
+        Run every loaded trigger once on a dummy pose and drop the gestures that raise.
+        
+        Catches configs that construct fine but fail at detection time, so they are
+        reported once at load instead of on every frame. Trigger state is reset afterwards.
+        
+        Returns:
+            Names of the dropped gestures
+        """
+        # All landmarks at the origin and fully visible, so triggers run past their
+        # visibility checks; no hands
+        landmarks = np.zeros((33, 4), dtype=np.float32)
+        landmarks[:, 3] = 1.0
+        frame_data = {"hands": None, "frame": None, "frame_number": 0, "timestamp": time.monotonic()}
+        
+        valid = []
+        dropped = []
+        for gesture in self.gestures:
+            try:
+                gesture.trigger.detect(landmarks, frame_data)
+                gesture.trigger.get_value()
+            except Exception:
+                _log.error("Dropping gesture '%s': trigger failed validation", gesture.name, exc_info=True)
+                dropped.append(gesture.name)
+            else:
+                valid.append(gesture)
+            gesture.trigger.reset()
+        
+        if dropped:
+            self.gestures[:] = valid
+            self._compile()
+        return dropped
     
-    def process(self, landmarks: object, additional_data: Optional[Dict[str, Any]] = None) -> List[Tuple[str, BaseAction, bool, float]]:
+    def process(self, landmarks: object, additional_data: Optional[Dict[str, Any]] = None) -> List[Tuple[int, BaseAction, bool, float]]:
         """
         Process a frame and detect active gestures.
         
         Args:
-            landmarks: MediaPipe pose landmarks
+            landmarks: (33, 4) pose landmark array from pose_landmarks_to_array()
             additional_data: Additional frame data (optional)
             
         Returns:
-            List of tuples: (gesture_name, action, is_active, trigger_value)
+            List of tuples: (gesture_id, action, is_active, trigger_value), where
+            gesture_id is the gesture's index in the loaded gesture list
         """
         if additional_data is None:
             additional_data = {}
         
         # Add frame metadata
+        # One monotonic clock read per frame, shared by all triggers (they only measure durations)
+        timestamp = time.monotonic()
         additional_data["frame_number"] = self.frame_number
-        additional_data["timestamp"] = time.time()
+        additional_data["timestamp"] = timestamp
         self.frame_number += 1
         
         results = []
+        append = results.append
         
         # Evaluate all gestures
-        for gesture in self.gestures:
+        for gesture_id, gesture, detect, get_value, action in self._compiled:
             try:
                 # Check if trigger is active
-                is_active = gesture.trigger.detect(landmarks, additional_data)
-                trigger_value = gesture.trigger.get_value()
+                is_active = detect(landmarks, additional_data)
                 
                 # Update last triggered time if active
                 if is_active:
-                    gesture.last_triggered_time = time.time()
+                    gesture.last_triggered_time = timestamp
                 
-                # Add to results
-                results.append((
-                    gesture.name,
-                    gesture.action,
-                    is_active,
-                    trigger_value
-                ))
+                append((gesture_id, action, is_active, get_value()))
                 
             except Exception as e:
-                print(f"Warning: Error processing gesture '{gesture.name}': {e}")
+                # A broken trigger fails on every frame; log it at most once per second
+                if timestamp - self._last_error_log[gesture_id] >= 1.0:
+                    self._last_error_log[gesture_id] = timestamp
+                    _log.warning("Error processing gesture '%s': %s", gesture.name, e)
         
         return results
     
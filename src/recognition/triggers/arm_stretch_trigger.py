@@ -1,5 +1,6 @@
 """Arm stretch trigger - detects arm pointing/stretching in a direction"""
 
+import time
 from typing import Dict, Any, Optional, Tuple
 import numpy as np
 from src.recognition.base_trigger import BaseTrigger
@@ -47,8 +48,8 @@ class ArmStretchTrigger(BaseTrigger):
             self.current_value = 0.0
             return False
         
-        import time
-        current_time = time.time()
+        # Frame timestamp from the gesture engine (monotonic seconds)
+        current_time = frame_data.get("timestamp") or time.monotonic()
         
         # Get arm landmarks
         if self.arm == "left":
@@ -86,7 +87,7 @@ class ArmStretchTrigger(BaseTrigger):
             self.is_active = result
             return result
         
-        if None in [wrist_pos, elbow_pos, shoulder_pos]:
+        if wrist_pos is None or elbow_pos is None or shoulder_pos is None:
             self.is_active = False
             self.current_value = 0.0
             return False
@@ -113,7 +114,7 @@ class ArmStretchTrigger(BaseTrigger):
         elbow_pos = get_landmark_position(landmarks, elbow_id)
         shoulder_pos = get_landmark_position(landmarks, shoulder_id)
         
-        if None in [wrist_pos, elbow_pos, shoulder_pos]:
+        if wrist_pos is None or elbow_pos is None or shoulder_pos is None:
             return False
         
         return self._check_arm_stretch(wrist_pos, elbow_pos, shoulder_pos, current_time)
@@ -42,7 +42,7 @@ class BodyLeanTrigger(BaseTrigger):
         left_hip = get_landmark_position(landmarks, LandmarkIndex.LEFT_HIP)
         right_hip = get_landmark_position(landmarks, LandmarkIndex.RIGHT_HIP)
         
-        if None in [left_shoulder, right_shoulder, left_hip, right_hip]:
+        if left_shoulder is None or right_shoulder is None or left_hip is None or right_hip is None:
             self.is_active = False
             self.current_value = 0.0
             return False
@@ -3,7 +3,7 @@
 from typing import Dict, Any, Optional
 from src.recognition.base_trigger import BaseTrigger
 from src.recognition.trigger_registry import TriggerRegistry
-from src.detection.hand_detector import is_hand_open, get_hand_landmark_position
+from src.detection.hand_detector import count_extended_fingers
 from src.utils.constants import MIN_LANDMARK_VISIBILITY
 
 
@@ -72,12 +72,20 @@ class HandGestureTrigger(BaseTrigger):
         if hand_data is None:
             return False
         
-        hand_landmarks = hand_data.get("landmarks")
+        # Prefer the per-frame landmark array, fall back to MediaPipe landmarks
+        hand_landmarks = hand_data.get("array")
+        if hand_landmarks is None:
+            hand_landmarks = hand_data.get("landmarks")
         if hand_landmarks is None:
             return False
         
-        # Determine if hand is open
-        is_open = is_hand_open(hand_landmarks)
+        # Determine if hand is open (3+ fingers extended, see is_hand_open)
+        try:
+            extended_count = count_extended_fingers(hand_landmarks)
+        except Exception:
+            self.current_value = 0.0
+            return False
+        is_open = extended_count >= 3
         
         # Check if it matches desired gesture
         if self.gesture == "open":
@@ -90,61 +98,30 @@ class HandGestureTrigger(BaseTrigger):
             # Calculate confidence based on how clearly the gesture is shown
             # For open: count extended fingers (higher = more confident)
             # For closed: count closed fingers (higher = more confident)
-            self.current_value = self._calculate_confidence(hand_landmarks, is_open)
+            self.current_value = self._calculate_confidence(extended_count, is_open)
         else:
             self.current_value = 0.0
         
         return matches and (self.current_value >= self.confidence_threshold)
     
-    def _calculate_confidence(self, hand_landmarks: object, is_open: bool) -> float:
+    def _calculate_confidence(self, extended_count: int, is_open: bool) -> float:
         """
         Calculate confidence score for the gesture (0.0-1.0).
         
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            extended_count: Number of extended fingers (0-5)
             is_open: Whether hand is detected as open
             
         Returns:
             Confidence value 0.0-1.0
         """
-        if hand_landmarks is None:
-            return 0.0
+        total_fingers = 5
         
-        try:
-            extended_count = 0
-            total_fingers = 5
-            
-            # Check each finger
-            finger_tips = [8, 12, 16, 20]  # Index, Middle, Ring, Pinky
-            finger_pips = [6, 10, 14, 18]
-            
-            for tip_idx, pip_idx in zip(finger_tips, finger_pips):
-                tip = hand_landmarks.landmark[tip_idx]
-                pip = hand_landmarks.landmark[pip_idx]
-                
-                if tip.y < pip.y:  # Extended
-                    extended_count += 1
-            
-            # Check thumb
-            thumb_tip = hand_landmarks.landmark[4]
-            thumb_ip = hand_landmarks.landmark[3]
-            wrist = hand_landmarks.landmark[0]
-            thumb_extended = abs(thumb_tip.x - wrist.x) > abs(thumb_ip.x - wrist.x)
-            
-            if thumb_extended:
-                extended_count += 1
-            
-            if is_open:
-                # Confidence increases with more extended fingers
-                confidence = extended_count / total_fingers
-            else:
-                # Confidence increases with more closed fingers
-                confidence = (total_fingers - extended_count) / total_fingers
-            
-            return confidence
-            
-        except Exception:
-            return 0.0
+        if is_open:
+            # Confidence increases with more extended fingers
+            return extended_count / total_fingers
+        # Confidence increases with more closed fingers
+        return (total_fingers - extended_count) / total_fingers
     
     def get_value(self) -> float:
         """Get trigger value (0.0-1.0 representing confidence)"""
@@ -81,7 +81,7 @@ class LegRaiseTrigger(BaseTrigger):
         knee_pos = get_landmark_position(landmarks, knee_id)
         ankle_pos = get_landmark_position(landmarks, ankle_id)
         
-        if None in [hip_pos, knee_pos, ankle_pos]:
+        if hip_pos is None or knee_pos is None or ankle_pos is None:
             return False
         
         # Check visibility
@@ -78,7 +78,8 @@ class MotionSpeedTrigger(BaseTrigger):
             self.current_value = 0.0
             return False
         
-        current_time = time.time()
+        # Frame timestamp from the gesture engine (monotonic seconds)
+        current_time = frame_data.get("timestamp") or time.monotonic()
         
         # Add to history
         self.position_history.append(pos)
@@ -55,7 +55,10 @@ class PointingGestureTrigger(BaseTrigger):
         if hand_data is None:
             return False
         
-        hand_landmarks = hand_data.get("landmarks")
+        # Prefer the per-frame landmark array, fall back to MediaPipe landmarks
+        hand_landmarks = hand_data.get("array")
+        if hand_landmarks is None:
+            hand_landmarks = hand_data.get("landmarks")
         if hand_landmarks is None:
             return False
         
@@ -64,7 +67,7 @@ class PointingGestureTrigger(BaseTrigger):
         index_pip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.INDEX_PIP)
         index_mcp = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.INDEX_MCP)
         
-        if None in [index_tip, index_pip, index_mcp]:
+        if index_tip is None or index_pip is None or index_mcp is None:
             self.current_value = 0.0
             return False
         
@@ -83,7 +86,8 @@ class PointingGestureTrigger(BaseTrigger):
         pinky_tip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.PINKY_TIP)
         pinky_pip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.PINKY_PIP)
         
-        if None in [middle_tip, middle_pip, ring_tip, ring_pip, pinky_tip, pinky_pip]:
+        if (middle_tip is None or middle_pip is None or ring_tip is None or
+                ring_pip is None or pinky_tip is None or pinky_pip is None):
             self.current_value = 0.0
             return False
         
@@ -99,7 +103,7 @@ class PointingGestureTrigger(BaseTrigger):
             thumb_ip = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.THUMB_IP)
             wrist = get_hand_landmark_position(hand_landmarks, HandLandmarkIndex.WRIST)
             
-            if None in [thumb_tip, thumb_ip, wrist]:
+            if thumb_tip is None or thumb_ip is None or wrist is None:
                 thumb_ok = False
             else:
                 # Thumb extended if tip is further from wrist than IP
@@ -43,7 +43,8 @@ class PoseHoldTrigger(BaseTrigger):
         
         # Check inner trigger
         inner_active = self.inner_trigger.detect(landmarks, frame_data)
-        current_time = time.time() * 1000  # Convert to milliseconds
+        # Frame timestamp from the gesture engine (monotonic seconds), in milliseconds
+        current_time = (frame_data.get("timestamp") or time.monotonic()) * 1000
         
         if inner_active:
             # Start timing if not already started
@@ -9,6 +9,8 @@ DEFAULT_CAMERA_FPS = 30
 DEFAULT_MODEL_COMPLEXITY = 0  # 0=fastest, 1=balanced, 2=most accurate
 DEFAULT_MIN_DETECTION_CONFIDENCE = 0.5
 DEFAULT_MIN_TRACKING_CONFIDENCE = 0.5
+DEFAULT_POSE_INFERENCE_WIDTH = 640  # Frames wider than this are downscaled before pose detection
+DEFAULT_HAND_INFERENCE_WIDTH = 640  # Frames wider than this are downscaled before hand detection
 
 # Trigger defaults
 DEFAULT_HAND_RAISE_THRESHOLD = 0.2
@@ -20,8 +22,8 @@ GAMEPAD_STICK_MAX_VALUE = 32767  # Maximum value for analog sticks
 GAMEPAD_TRIGGER_MAX_VALUE = 255  # Maximum value for triggers
 
 # Processing defaults
-PROCESSING_TIMER_INTERVAL_MS = 33  # ~30 FPS
-GESTURE_MONITOR_UPDATE_INTERVAL = 2  # Update every N frames
+USE_OPENCL = False  # Run the inference worker's downscale + RGB conversion via OpenCV's OpenCL path
+GESTURE_MONITOR_UPDATE_INTERVAL_MS = 100  # Gesture monitor refresh period (~10 Hz)
 MAX_FRAME_SKIP_COUNT = 10  # Warn if skipping too many frames
 
 # Debouncing
@@ -0,0 +1,21 @@
+"""Image helper functions"""
+
+from typing import Optional, Tuple
+
+
+def compute_inference_size(width: int, height: int, max_width: Optional[int]) -> Optional[Tuple[int, int]]:
+    """
+    Compute the size to downscale a frame to before detection.
+    
+    Args:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        max_width: Maximum width to run detection at, or None for no limit
+        
+    Returns:
+        (width, height) keeping the aspect ratio, or None if the frame needs no resizing
+    """
+    if max_width is None or width <= max_width:
+        return None
+    scale = max_width / width
+    return (max_width, max(1, round(height * scale)))
@@ -0,0 +1,84 @@
+"""Logging configuration that keeps log I/O off the real-time threads"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+from typing import Optional
+
+# Environment variable overriding the log level (a level name such as DEBUG)
+LOG_LEVEL_ENV_VAR = "MOTION_CONTROLLER_LOG_LEVEL"
+
+# Records waiting for the listener thread; beyond this new records are dropped
+_QUEUE_SIZE = 1000
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """Queue listener whose stop sentinel waits for room in a full queue"""
+    
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+def _level_from_env(default: int) -> int:
+    """
+    Read the log level from the environment.
+    
+    Args:
+        default: Level used when the variable is unset or not a known level name
+        
+    Returns:
+        Logging level
+    """
+    name = os.environ.get(LOG_LEVEL_ENV_VAR, "").strip().upper()
+    if not name:
+        return default
+    level = logging.getLevelName(name)
+    return level if isinstance(level, int) else default
+
+
+def setup_logging(level: int = logging.INFO):
+    """
+    Route all logging through a bounded queue drained by a background thread.
+    
+    Callers on the frame processing path only enqueue records; formatting
+    and console writes happen on the listener thread. If the listener falls
+    behind, new records are dropped rather than blocking the caller.
+    
+    Args:
+        level: Minimum level for the root logger, unless overridden by the
+            MOTION_CONTROLLER_LOG_LEVEL environment variable
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    log_queue: queue.Queue = queue.Queue(maxsize=_QUEUE_SIZE)
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    
+    root = logging.getLogger()
+    root.setLevel(_level_from_env(level))
+    root.addHandler(_DroppingQueueHandler(log_queue))
+    
+    _listener = _QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
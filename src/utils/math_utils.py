@@ -1,9 +1,44 @@
 """Mathematical utility functions for pose calculations"""
 
+import math
 import numpy as np
 from typing import Tuple
 
 
+# Scalar helpers for the public functions below. They are called once per landmark
+# pair, so plain math on floats beats both numpy and a JIT call boundary here.
+def _angle_2d(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Angle in degrees at (bx, by) formed with (ax, ay) and (cx, cy)"""
+    v1x = ax - bx
+    v1y = ay - by
+    v2x = cx - bx
+    v2y = cy - by
+    
+    magnitude1 = math.sqrt(v1x * v1x + v1y * v1y)
+    magnitude2 = math.sqrt(v2x * v2x + v2y * v2y)
+    if magnitude1 == 0.0 or magnitude2 == 0.0:
+        return 0.0
+    
+    cos_angle = (v1x * v2x + v1y * v2y) / (magnitude1 * magnitude2)
+    cos_angle = min(1.0, max(-1.0, cos_angle))  # Handle floating point errors
+    return math.degrees(math.acos(cos_angle))
+
+
+def _distance_2d(ax: float, ay: float, bx: float, by: float) -> float:
+    """Euclidean distance between (ax, ay) and (bx, by)"""
+    dx = bx - ax
+    dy = by - ay
+    return math.sqrt(dx * dx + dy * dy)
+
+
+def _distance_3d(ax: float, ay: float, az: float, bx: float, by: float, bz: float) -> float:
+    """Euclidean distance between (ax, ay, az) and (bx, by, bz)"""
+    dx = bx - ax
+    dy = by - ay
+    dz = bz - az
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
 def calculate_angle_2d(point1: Tuple[float, float], 
                        point2: Tuple[float, float], 
                        point3: Tuple[float, float]) -> float:
@@ -21,26 +56,7 @@ def calculate_angle_2d(point1: Tuple[float, float],
     x1, y1 = point1
     x2, y2 = point2
     x3, y3 = point3
-    
-    # Create vectors
-    vector1 = np.array([x1 - x2, y1 - y2])
-    vector2 = np.array([x3 - x2, y3 - y2])
-    
-    # Calculate angle using dot product
-    dot_product = np.dot(vector1, vector2)
-    magnitude1 = np.linalg.norm(vector1)
-    magnitude2 = np.linalg.norm(vector2)
-    
-    if magnitude1 == 0 or magnitude2 == 0:
-        return 0.0
-    
-    cos_angle = dot_product / (magnitude1 * magnitude2)
-    cos_angle = np.clip(cos_angle, -1.0, 1.0)  # Handle floating point errors
-    
-    angle_radians = np.arccos(cos_angle)
-    angle_degrees = np.degrees(angle_radians)
-    
-    return angle_degrees
+    return _angle_2d(x1, y1, x2, y2, x3, y3)
 
 
 def calculate_distance_2d(point1: Tuple[float, float], 
@@ -57,7 +73,7 @@ def calculate_distance_2d(point1: Tuple[float, float],
     """
     x1, y1 = point1
     x2, y2 = point2
-    return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return _distance_2d(x1, y1, x2, y2)
 
 
 def calculate_distance_3d(point1: Tuple[float, float, float], 
@@ -74,7 +90,7 @@ def calculate_distance_3d(point1: Tuple[float, float, float],
     """
     x1, y1, z1 = point1
     x2, y2, z2 = point2
-    return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2)
+    return _distance_3d(x1, y1, z1, x2, y2, z2)
 
 
 def normalize_point(point: Tuple[float, float], 
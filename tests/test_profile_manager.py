@@ -0,0 +1,75 @@
+"""Tests for profile loading, saving and caching"""
+
+import os
+import tempfile
+import unittest
+import yaml
+from src.config.profile_manager import ProfileManager
+from src.config.profile_schema import Profile
+
+
+PROFILE_DATA = {
+    "name": "Demo",
+    "description": "Test profile",
+    "game": "Test",
+    "layout": "wasd",
+    "gestures": [
+        {
+            "name": "Jump",
+            "trigger": {"type": "hand_raise", "params": {"hand": "left"}, "note": "keep me"},
+            "action": {"type": "keyboard", "params": {"key": "space"}},
+            "cooldown_ms": 250,
+        }
+    ],
+}
+
+
+class TestProfileManager(unittest.TestCase):
+    """ProfileManager file round-trips and cache invalidation"""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.manager = ProfileManager(self._tmp.name)
+        self.path = os.path.join(self._tmp.name, "demo.yaml")
+        with open(self.path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(PROFILE_DATA, f, sort_keys=False)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_unknown_keys_survive_load_save(self):
+        profile = self.manager.load_profile(self.path)
+        out_path = os.path.join(self._tmp.name, "copy.yaml")
+        self.assertTrue(self.manager.save_profile(profile, out_path))
+        
+        with open(out_path, encoding="utf-8") as f:
+            saved = yaml.safe_load(f)
+        self.assertEqual(saved["layout"], "wasd")
+        self.assertEqual(saved["gestures"][0]["cooldown_ms"], 250)
+        self.assertEqual(saved["gestures"][0]["trigger"]["note"], "keep me")
+        self.assertEqual(self.manager.load_profile(out_path), profile)
+    
+    def test_unchanged_file_hits_cache(self):
+        first = self.manager.load_profile(self.path)
+        self.assertIs(self.manager.load_profile(self.path), first)
+    
+    def test_save_invalidates_cache(self):
+        first = self.manager.load_profile(self.path)
+        updated = Profile.from_dict(dict(PROFILE_DATA, name="Renamed"))
+        self.assertTrue(self.manager.save_profile(updated, self.path))
+        self.assertNotIn(os.path.abspath(self.path), self.manager._cache)
+        
+        reloaded = self.manager.load_profile(self.path)
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded.name, "Renamed")
+    
+    def test_delete_invalidates_cache(self):
+        self.manager.load_profile(self.path)
+        self.assertTrue(self.manager.delete_profile(self.path))
+        
+        self.assertNotIn(os.path.abspath(self.path), self.manager._cache)
+        self.assertIsNone(self.manager.load_profile(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
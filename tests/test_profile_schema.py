@@ -0,0 +1,74 @@
+"""Tests for profile configuration models"""
+
+import unittest
+from src.config.profile_schema import GestureConfig, Profile
+
+
+def _gesture_dict():
+    """Minimal valid gesture configuration"""
+    return {
+        "name": "Jump",
+        "trigger": {"type": "hand_raise", "params": {"hand": "left"}},
+        "action": {"type": "keyboard", "params": {"key": "space"}},
+    }
+
+
+class TestProfileFromDict(unittest.TestCase):
+    """Validation in Profile.from_dict and the nested models"""
+    
+    def test_valid_profile(self):
+        profile = Profile.from_dict({"name": "Demo", "gestures": [_gesture_dict()]})
+        self.assertEqual(profile.name, "Demo")
+        self.assertEqual(profile.description, "")
+        self.assertEqual(profile.gestures[0].trigger.type, "hand_raise")
+        self.assertTrue(profile.gestures[0].enabled)
+    
+    def test_missing_required_field(self):
+        with self.assertRaises(ValueError):
+            Profile.from_dict({"description": "No name"})
+        
+        gesture = _gesture_dict()
+        del gesture["trigger"]
+        with self.assertRaises(ValueError):
+            GestureConfig.from_dict(gesture)
+    
+    def test_wrong_type(self):
+        with self.assertRaises(ValueError):
+            Profile.from_dict({"name": 42})
+        
+        gesture = _gesture_dict()
+        gesture["enabled"] = "yes"
+        with self.assertRaises(ValueError):
+            Profile.from_dict({"name": "Demo", "gestures": [gesture]})
+        
+        gesture = _gesture_dict()
+        gesture["action"]["params"] = ["space"]
+        with self.assertRaises(ValueError):
+            GestureConfig.from_dict(gesture)
+    
+    def test_non_mapping(self):
+        with self.assertRaises(ValueError):
+            Profile.from_dict({"name": "Demo", "gestures": ["Jump"]})
+
+
+class TestProfileRoundTrip(unittest.TestCase):
+    """Unknown keys are kept through from_dict/to_dict"""
+    
+    def test_unknown_keys_survive(self):
+        gesture = _gesture_dict()
+        gesture["cooldown_ms"] = 250
+        gesture["trigger"]["note"] = "left hand only"
+        gesture["action"]["device"] = {"index": 1}
+        data = {"name": "Demo", "version": 2, "gestures": [gesture]}
+        
+        result = Profile.from_dict(data).to_dict()
+        
+        self.assertEqual(result["version"], 2)
+        self.assertEqual(result["gestures"][0]["cooldown_ms"], 250)
+        self.assertEqual(result["gestures"][0]["trigger"]["note"], "left hand only")
+        self.assertEqual(result["gestures"][0]["action"]["device"], {"index": 1})
+        self.assertEqual(Profile.from_dict(result), Profile.from_dict(data))
+
+
+if __name__ == "__main__":
+    unittest.main()